@@ -1,42 +1,71 @@
+import re
+import sys
+
 from layout_data import LayoutData
 from viewer import display_layout_canvas
 
+# Prompt templates; filled with the object's display name once per edit
+_RECT_PROMPTS = {
+    'width': "{name} width",
+    'height': "{name} length",
+    'x': "Distance from left property line to {lname} (ft)",
+    'y': "Distance from front property line to {lname} (ft)"
+}
+_POINT_PROMPTS = {
+    'x': _RECT_PROMPTS['x'],
+    'y': _RECT_PROMPTS['y']
+}
+
+
+def _ask(prompt):
+    """Prompt and return the stripped reply; skips input() when stdin is piped."""
+    if sys.stdin.isatty():
+        return input(prompt).strip()  # keep readline editing for people
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.strip()
+
+
+# Plain decimal number: optional sign, digits, optional fractional part
+_NUM_RE = re.compile(r"^-?(?:\d+(?:\.\d*)?|\.\d+)$")
+
+
+def _edit_fields(obj, prompts):
+    """Prompt for each field in prompts (in order); blank keeps the current value."""
+    lname = obj.name.lower()
+    print(f"\nEditing {obj.name}:")
+    for field, template in prompts.items():
+        current = getattr(obj, field)
+        label = template.format(name=obj.name, lname=lname)
+        entry = _ask(f"{label} ({current}): ")
+        if entry:
+            if _NUM_RE.match(entry):
+                setattr(obj, field, float(entry))
+                obj.mark_dirty()
+            else:
+                print("Invalid value. Keeping previous.")
+
 
 def run_editor(layout: LayoutData, filename: str):
     def edit_rectangle(obj):
-        prompts = {
-            'width': f"{obj.name} width",
-            'height': f"{obj.name} length",
-            'x': f"Distance from left property line to {obj.name.lower()} (ft)",
-            'y': f"Distance from front property line to {obj.name.lower()} (ft)"
-        }
-        print(f"\nEditing {obj.name}:")
-        for field in ['width', 'height', 'x', 'y']:
-            current = getattr(obj, field)
-            prompt = f"{prompts[field]} ({current}): "
-            entry = input(prompt).strip()
-            if entry:
-                try:
-                    setattr(obj, field, float(entry))
-                except ValueError:
-                    print("Invalid value. Keeping previous.")
+        _edit_fields(obj, _RECT_PROMPTS)
 
     def edit_point(obj):
-        prompts = {
-            'x': f"Distance from left property line to {obj.name.lower()} (ft)",
-            'y': f"Distance from front property line to {obj.name.lower()} (ft)"
-        }
-        print(f"\nEditing {obj.name}:")
-        for field in ['x', 'y']:
-            current = getattr(obj, field)
-            prompt = f"{prompts[field]} ({current}): "
-            entry = input(prompt).strip()
-            if entry:
-                try:
-                    setattr(obj, field, float(entry))
-                except ValueError:
-                    print("Invalid value. Keeping previous.")
+        _edit_fields(obj, _POINT_PROMPTS)
 
+    # Menu choice -> (edit helper, object getter, redraw canvas afterwards)
+    actions = {
+        "1": (edit_rectangle, lambda: layout.house, True),
+        "2": (edit_rectangle, lambda: layout.shed, True),
+        "3": (edit_point, lambda: layout.well, False),
+        "4": (edit_point, lambda: layout.septic, False),
+    }
+
+    # Edits are batched: the canvas is shown once when the user leaves the menu
+    dirty = False
     while True:
         print("\nWhich object would you like to edit?")
         print("1. House")
@@ -44,19 +73,16 @@ def run_editor(layout: LayoutData, filename: str):
         print("3. Well")
         print("4. Septic Tank")
         print("5. Back to main menu")
-        choice = input("Select an option: ").strip()
-
-        if choice == "1":
-            edit_rectangle(layout.house)
-            display_layout_canvas(layout, filename)
-        elif choice == "2":
-            edit_rectangle(layout.shed)
-            display_layout_canvas(layout, filename)
-        elif choice == "3":
-            edit_point(layout.well)
-        elif choice == "4":
-            edit_point(layout.septic)
+        choice = _ask("Select an option: ")
+
+        action = actions.get(choice)
+        if action is not None:
+            edit, get_obj, redraw = action
+            edit(get_obj())
+            dirty = dirty or redraw
         elif choice == "5":
+            if dirty:
+                display_layout_canvas(layout, filename)
             break
         else:
             print("Invalid option. Please try again.")
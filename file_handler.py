@@ -1,37 +1,173 @@
 import os
 import sys
 import json
+import gzip
+import stat
+import tempfile
 from  layout_data import LayoutData
 from typing import Any
 
+try:
+    import orjson  # optional: C-level JSON encoder/decoder
+except ImportError:
+    orjson = None
+
+msgspec = None
+if orjson is None:
+    try:
+        import msgspec  # optional: C-level fallback when orjson is missing
+    except ImportError:
+        pass
+
 SAVE_DIR = os.path.expanduser("~/gui_scale_drawing/layouts")
-os.makedirs(SAVE_DIR, exist_ok=True)
+_save_dir_ready = False  # SAVE_DIR is created on the first save, not at import
+
+# abs path -> (payload hash, size, mtime_ns) of the last file this process wrote
+_last_written: dict[str, tuple] = {}
+
+# Process umask, read once (os.umask can only be queried by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Resolved once: the PyInstaller bundle dir when frozen, else the startup CWD
+_BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.abspath(".")
 
 def resource_path(relative_path):
     """Get absolute path to resource (for dev and PyInstaller bundle)"""
-    base_path = getattr(sys, "_MEIPASS", os.path.abspath("."))
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, relative_path)
+
+
+def _encode(data, pretty: bool) -> bytes:
+    """Serialize a layout dict to JSON bytes (orjson or msgspec when available).
+
+    Pretty output always comes from the stdlib, so it is indented the same way
+    (4 spaces) whichever encoder is installed; orjson can only indent by 2.
+    """
+    if pretty:
+        return json.dumps(data, indent=4).encode("utf-8")
+    if orjson is not None:
+        return orjson.dumps(data)
+    if msgspec is not None:
+        return msgspec.json.encode(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _atomic_write(filename: str, payload: bytes):
+    """Write payload to a temp file beside filename, then swap it into place.
+
+    A crash mid-save leaves the previous file intact instead of a truncated one.
+    """
+    dir_ = os.path.dirname(filename) or "."
+    fd, tmp = tempfile.mkstemp(prefix=".tmp_", dir=dir_)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        # mkstemp creates 0600 files; keep the mode an ordinary save would have
+        try:
+            mode = stat.S_IMODE(os.stat(filename).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK  # what open() would give a new file
+        os.chmod(tmp, mode)
+        os.replace(tmp, filename)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
 
+def _same_as_last_write(key: str, digest: int) -> bool:
+    """True if we already wrote this payload to key and the file is untouched since."""
+    prev = _last_written.get(key)
+    if prev is None or prev[0] != digest:
+        return False
+    try:
+        st = os.stat(key)
+    except OSError:
+        return False
+    return (st.st_size, st.st_mtime_ns) == prev[1:]
 
-def save_layout_to_file(layout: Any, filename: str):
-    """Save either a LayoutData object (with .to_dict) or a raw dict to JSON safely."""
-    # Build data first (may raise if to_dict missing)
-    if hasattr(layout, "to_dict"):
-        data = layout.to_dict()
-    elif isinstance(layout, dict):
-        data = layout
+
+def save_layout_to_file(layout: Any, filename: str, pretty: bool = False):
+    """Save either a LayoutData object (with .to_dict) or a raw dict to JSON safely.
+
+    Writes compact JSON by default. Pass pretty=True for indented output when the
+    file is meant to be read by a person; indenting makes the file several times
+    larger and slower to produce.
+
+    A filename ending in ".gz" (e.g. "yard.json.gz") is written gzip-compressed.
+    """
+    global _save_dir_ready
+    if not _save_dir_ready:
+        os.makedirs(SAVE_DIR, exist_ok=True)
+        _save_dir_ready = True
+
+    # Reuse the last payload if the layout hasn't changed since it was built
+    cached = getattr(layout, "_payload_cache", None)
+    if (cached is not None and cached[0] == layout._cache_key(pretty)
+            and not layout.dirty):
+        payload = cached[1]
     else:
-        raise TypeError("save_layout_to_file expects a LayoutData with .to_dict() or a dict.")
+        # Build data first (may raise if to_dict missing)
+        if hasattr(layout, "to_dict"):
+            data = layout.to_dict()
+        elif isinstance(layout, dict):
+            data = layout
+        else:
+            raise TypeError("save_layout_to_file expects a LayoutData with .to_dict() or a dict.")
+        payload = _encode(data, pretty)
+        if isinstance(layout, LayoutData):
+            layout._payload_cache = (layout._cache_key(pretty), payload)
+            layout.mark_clean()
+
+    if os.fspath(filename).endswith(".gz"):
+        # Fast level: most of the size win for little CPU; mtime=0 keeps the
+        # output deterministic so unchanged layouts still skip the write below
+        payload = gzip.compress(payload, compresslevel=1, mtime=0)
+
+    # Skip the write entirely if the file already holds exactly these bytes
+    key = os.path.abspath(filename)
+    digest = hash(payload)
+    if _same_as_last_write(key, digest):
+        return
+
+    # Only after we have data, write it out
+    _atomic_write(filename, payload)
+    st = os.stat(key)
+    _last_written[key] = (digest, st.st_size, st.st_mtime_ns)
+
+def _decode(blob: bytes):
+    """Parse JSON bytes with the fastest available backend."""
+    if orjson is not None:
+        return orjson.loads(blob)
+    if msgspec is not None:
+        return msgspec.json.decode(blob)
+    return json.loads(blob)
+
+
+def _read_bytes(path: str) -> bytes:
+    """Read a whole file with one fstat-sized os.read; no text layer, no chunking."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        blob = os.read(fd, size)
+        while len(blob) < size:  # short reads are rare, but allowed
+            chunk = os.read(fd, size - len(blob))
+            if not chunk:
+                break
+            blob += chunk
+        return blob
+    finally:
+        os.close(fd)
 
-    # Only after we have data, open and write
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
 
 def load_layout_from_file(path):
-    """Load a layout from a .json file at the given path and return (layout, path)."""
+    """Load a layout from a .json (or .json.gz) file at the given path and return (layout, path)."""
     full_path = resource_path(path)
-    with open(full_path, "r") as f:
-        data = json.load(f)
-        layout = LayoutData.from_dict(data)
-        return layout, path
-
+    blob = _read_bytes(full_path)
+    if full_path.endswith(".gz"):
+        blob = gzip.decompress(blob)
+    data = _decode(blob)
+    layout = LayoutData.from_dict(data)
+    return layout, path
@@ -1,32 +1,56 @@
 #ruff check . gui_main_menu.py
 import tkinter as tk
-import re
 import os
 import sys
 import subprocess
+import threading
+import copy
+import dataclasses
+import functools
+import operator
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, messagebox, filedialog
 from typing import Optional
 from layout_data import LayoutData, RectangleObject, PointObject
 from pathlib import Path
-from file_handler import load_layout_from_file, save_layout_to_file
-from layout_canvas import LayoutCanvas
-from print_export import export_to_pdf
+# file_handler, layout_canvas and print_export (ReportLab) are imported where first used,
+# so the main menu paints without loading them.
 
 # --- Robust error logging helpers (single source of truth) ---
 import datetime
 import traceback 
 import tempfile
 
-LOG_PATH = os.path.join(tempfile.gettempdir(), "ScaleDrawing_error_log.txt")
+LOG_FILE = Path(tempfile.gettempdir(), "ScaleDrawing_error_log.txt")
+LOG_PATH = str(LOG_FILE)  # string form for messages and external viewers
+
+# User-facing error texts; LOG_PATH never changes, so build them once
+_USER_MSG = f"An error was logged to:\n{LOG_PATH}\n\nAttempting to open it now."
+_SEE_LOG = f"\nSee log at:\n{LOG_PATH}"
+
+_LOG_FH = None  # opened on first write and kept open for later entries
+# Entries come from the Tk thread and the PDF export worker
+_LOG_LOCK = threading.Lock()
+
+def _log_file():
+    global _LOG_FH
+    if _LOG_FH is None:
+        _LOG_FH = LOG_FILE.open("ab")
+    return _LOG_FH
 
 def _write_log(title, exc_type=None, exc=None, tb=None, extra=None):
     try:
-        with open(LOG_PATH, "a", encoding="utf-8") as f:
-            f.write(f"\n=== {title} === {datetime.datetime.now().isoformat()} ===\n")
-            if extra:
-                f.write(extra + "\n")
-            if exc_type:
-                traceback.print_exception(exc_type, exc, tb, file=f)
+        # Build the whole entry first, then write and flush it in one go
+        parts = [f"\n=== {title} === {datetime.datetime.now().isoformat()} ===\n"]
+        if extra:
+            parts.append(extra + "\n")
+        if exc_type:
+            parts.extend(traceback.format_exception(exc_type, exc, tb))
+        entry = "".join(parts).encode("utf-8")
+        with _LOG_LOCK:
+            fh = _log_file()
+            fh.write(entry)
+            fh.flush()  # on disk now, so a hard kill can't lose it
     except Exception as e:
         print(f"[ERR] Could not write log: {e}")
 
@@ -42,16 +66,19 @@ def _open_log_in_notepad():
         print(f"[ERR] Could not open Notepad: {e}")
         print(f"[INFO] Log is at: {LOG_PATH}")
 
+def _report_error(log_title, user_title, user_msg):
+    """Log the exception being handled, point the user at the log, and open it."""
+    _write_log(log_title, *sys.exc_info())
+    messagebox.showerror(user_title, user_msg + _SEE_LOG)
+    _open_log_in_notepad()
+
 def install_global_excepthook():
     def _hook(exc_type, exc, tb):
         _write_log("UNHANDLED EXCEPTION", exc_type, exc, tb)
         try:
             tmp = tk.Tk() 
             tmp.withdraw()
-            messagebox.showerror(
-                "Unexpected Error",
-                f"An error was logged to:\n{LOG_PATH}\n\nAttempting to open it now."
-            )
+            messagebox.showerror("Unexpected Error", _USER_MSG)
         except Exception:
             pass
         finally:
@@ -66,10 +93,7 @@ def install_tk_report_hook(root: tk.Tk):
     def _report_callback_exception(exc_type, exc, tb):
         _write_log("TK CALLBACK EXCEPTION", exc_type, exc, tb)
         try:
-            messagebox.showerror(
-                "Unexpected Error",
-                f"An error was logged to:\n{LOG_PATH}\n\nAttempting to open it now."
-            )
+            messagebox.showerror("Unexpected Error", _USER_MSG)
         except Exception:
             pass
         finally:
@@ -81,6 +105,8 @@ def install_tk_report_hook(root: tk.Tk):
 APP_VERSION = "1.0.0"  # set your release version here
 
 # ---- Stable, user-visible data root: Documents\ScaleDrawing ----
+# Resolved (and mkdir'd) once per process; the cached Paths are immutable.
+@functools.lru_cache(maxsize=1)
 def get_user_data_root() -> Path:
     # Windows: C:\Users\<User>\Documents\ScaleDrawing
     # (Works fine on macOS/Linux too: ~/Documents/ScaleDrawing)
@@ -89,34 +115,50 @@ def get_user_data_root() -> Path:
     base.mkdir(parents=True, exist_ok=True)
     return base
 
+@functools.lru_cache(maxsize=1)
 def get_layouts_dir() -> Path:
     d = get_user_data_root() / "layouts"
     d.mkdir(parents=True, exist_ok=True)
     return d
 
+@functools.lru_cache(maxsize=1)
 def get_prints_dir() -> Path:
     d = get_user_data_root() / "print"
     d.mkdir(parents=True, exist_ok=True)
     return d
 
+# String forms for the Tk file dialogs' initialdir
+@functools.lru_cache(maxsize=1)
+def get_layouts_dir_str() -> str:
+    return os.fspath(get_layouts_dir())
+
+@functools.lru_cache(maxsize=1)
+def get_prints_dir_str() -> str:
+    return os.fspath(get_prints_dir())
+
+@functools.lru_cache(maxsize=1)
 def ensure_app_dirs():
     get_layouts_dir()
     get_prints_dir()
 
 def pdf_path_for_layout(json_path: str | Path) -> Path:
     """Return the corresponding PDF path in the print/ dir for a given layout.json path"""
-    json_path = Path(json_path)
-    return get_prints_dir() / f"{json_path.stem}.pdf"
+    p = json_path if isinstance(json_path, Path) else Path(json_path)
+    return get_prints_dir() / f"{p.stem}.pdf"
 
-ICON_PATH =  "gui_icon.ico"
+# Resolved once: next to this file, or inside the PyInstaller bundle when frozen.
+# None when the icon isn't shipped, so windows skip iconbitmap entirely.
+_ICON_FILE = Path(getattr(sys, "_MEIPASS", None) or Path(__file__).resolve().parent) / "gui_icon.ico"
+ICON_PATH = str(_ICON_FILE) if _ICON_FILE.exists() else None
 
 def open_editor_window(root, layout, file_path):
     win = tk.Toplevel(root)
     win.title(f"Layout Editor — v{APP_VERSION}")
-    try:
-        win.iconbitmap(ICON_PATH)
-    except Exception:
-        pass
+    if ICON_PATH:
+        try:
+            win.iconbitmap(ICON_PATH)
+        except Exception:
+            pass
 
     # ✅ Enable normal Windows chrome buttons
     win.resizable(True, True)   # allow maximize
@@ -141,25 +183,30 @@ def open_editor_window(root, layout, file_path):
 
     # Create the editor frame (LayoutCanvas) with hard error surfacing
     try:
+        from layout_canvas import LayoutCanvas
         editor = LayoutCanvas(win, layout, file_path)
         # NEW: hook PDF regeneration after edits
         def _regenerate_pdf_for_current():
-            try:
-                out_pdf = pdf_path_for_layout(file_path)
-                export_to_pdf(layout, str(out_pdf), show_distance_guides=True)
-                print(f"[INFO] PDF regenerated at {out_pdf}")
-            except Exception as e:
-                print("[WARN] PDF regeneration failed:", e)
+            out_pdf = str(pdf_path_for_layout(file_path))
+
+            def _work(snapshot):
+                try:
+                    from print_export import export_to_pdf
+                    export_to_pdf(snapshot, out_pdf, show_distance_guides=True)
+                    print(f"[INFO] PDF regenerated at {out_pdf}")
+                except Exception as e:
+                    print("[WARN] PDF regeneration failed:", e)
+
+            # Same queue as the menu's exports, so two renders never write this PDF at once
+            _pdf_pool.submit(_work, copy.deepcopy(layout))
 
         editor.on_layout_changed = _regenerate_pdf_for_current
 
     except Exception:
-        import sys
-        import traceback
         _write_log("Editor Error (LayoutCanvas)", *sys.exc_info())
         messagebox.showerror(
             "Editor Error (LayoutCanvas)",
-            f"An error was logged to:\n{LOG_PATH}\n\nOpening it now."
+            _USER_MSG
         )
         _open_log_in_notepad()
         try:
@@ -169,46 +216,8 @@ def open_editor_window(root, layout, file_path):
         return None
 
     editor.pack(fill="both", expand=True)
-
-    def _regenerate_pdf_for_current():
-        out_pdf = pdf_path_for_layout(file_path)
-        export_to_pdf(layout, str(out_pdf), show_distance_guides=True)
-    editor.on_layout_changed = _regenerate_pdf_for_current
-    
-
-    # --- View menu with toggles ---
-    menubar = tk.Menu(win)
-    view_menu = tk.Menu(menubar, tearoff=0)
-
-    show_guides_var = tk.BooleanVar(value=True)    # show guides on startup
-    live_guides_var = tk.BooleanVar(value=False)   # live updates off by default
-
-    def _toggle_show_guides():
-        editor.set_show_distance_guides(show_guides_var.get())
-
-    def _toggle_live_guides():
-        editor.set_live_guide_updates(live_guides_var.get())
-
-    view_menu.add_checkbutton(
-        label="Show distance guides",
-        variable=show_guides_var,
-        command=_toggle_show_guides
-    )
-    view_menu.add_checkbutton(
-        label="Live updates while dragging",
-        variable=live_guides_var,
-        command=_toggle_live_guides
-    )
-
-    menubar.add_cascade(label="View", menu=view_menu)
-    win.config(menu=menubar)
-
-    # Ensure guides start ON (matches your current behavior)
-    win.after(0, lambda: (
-        show_guides_var.set(True),
-        editor.set_show_distance_guides(True)
-    ))
-
+    # Guides start ON; the View menu checkbutton below is created checked to match
+    editor.set_show_distance_guides(True)
 
     # --- View menu with toggles ---
     menubar = tk.Menu(win)
@@ -239,11 +248,6 @@ def open_editor_window(root, layout, file_path):
     menubar.add_cascade(label="View", menu=view_menu)
     win.config(menu=menubar)
 
-    # Ensure guides start ON (matches your previous behavior)
-    win.after(0, lambda: (
-        show_guides_var.set(True),
-        editor.set_show_distance_guides(True)
-    ))
     
 
     # Show & raise the window BEFORE withdrawing the menu
@@ -260,7 +264,7 @@ def open_editor_window(root, layout, file_path):
     # Bring it to the front
     try:
         win.attributes("-topmost", True)
-        win.update()
+        win.update_idletasks()  # map/redraw only; no need to pump user events here
         win.attributes("-topmost", False)
         win.lift()
         win.focus_force()
@@ -301,13 +305,30 @@ APP_FONT_BASE   = ("Segoe UI", 13)
 APP_FONT_HEADER = ("Segoe UI Semibold", 14)
 APP_DIALOG_SIZE = "680x640"   # global dialog size
 
+# Numeric entry filter: up to 5 digits, optional decimal point + up to 2 decimals.
+# Defined as a Tcl proc so per-keystroke validation never calls back into Python.
+_VALIDATE_PROC = "::scaledrawing_validnum"
+_VALIDATE_BODY = r'return [expr {$P eq "" || [regexp {^\d{0,5}(\.\d{0,2})?$} $P]}]'
+
+# ttk style name -> font
+_STYLE_SPEC = (
+    ("App.TLabel",        APP_FONT_BASE),
+    ("App.Header.TLabel", APP_FONT_HEADER),
+    ("App.TEntry",        APP_FONT_BASE),
+    ("App.TCheckbutton",  APP_FONT_BASE),
+    ("App.TButton",       APP_FONT_BASE),
+)
+_styles_applied = False
+
 def apply_ttk_styles(root: tk.Misc) -> None:
+    # Styles live on the Tk interpreter, so configuring them once is enough
+    global _styles_applied
+    if _styles_applied:
+        return
     style = ttk.Style(root)
-    style.configure("App.TLabel",        font=APP_FONT_BASE)
-    style.configure("App.Header.TLabel", font=APP_FONT_HEADER)
-    style.configure("App.TEntry",        font=APP_FONT_BASE)
-    style.configure("App.TCheckbutton",  font=APP_FONT_BASE)
-    style.configure("App.TButton",       font=APP_FONT_BASE)
+    for name, font in _STYLE_SPEC:
+        style.configure(name, font=font)
+    _styles_applied = True
 
 class ButtonBar(tk.Frame):
     """Centered wide buttons for OK/Cancel/etc."""
@@ -317,18 +338,104 @@ class ButtonBar(tk.Frame):
             b = tk.Button(self, text=text, font=APP_FONT_BASE, width=14, command=cmd)
             b.pack(side="left", padx=10)
 
+# Older LayoutData versions called the septic object 'septic_tank'; resolve once
+# (default_factory fields aren't class attributes, so ask dataclasses, not hasattr)
+_SEPTIC_ATTR = ("septic" if "septic" in {f.name for f in dataclasses.fields(LayoutData)}
+                else "septic_tank")
+_get_septic = operator.attrgetter(_SEPTIC_ATTR)
+
+# Form key -> value to pre-fill from an existing LayoutData (None if absent)
+_KEY_EXTRACTORS = {
+    # Boundaries (always present; plain C-level getters)
+    "front": operator.attrgetter("front"),
+    "back":  operator.attrgetter("back"),
+    "left":  operator.attrgetter("left"),
+    "right": operator.attrgetter("right"),
+
+    # House (RectangleObject)
+    "house_width":  lambda ld: ld.house.width  if ld.house else None,
+    "house_height": lambda ld: ld.house.height if ld.house else None,
+    "house_x":      lambda ld: ld.house.x      if ld.house else None,
+    "house_y":      lambda ld: ld.house.y      if ld.house else None,
+
+    # Shed (RectangleObject)
+    "shed_width":  lambda ld: ld.shed.width  if ld.shed else None,
+    "shed_height": lambda ld: ld.shed.height if ld.shed else None,
+    "shed_x":      lambda ld: ld.shed.x      if ld.shed else None,
+    "shed_y":      lambda ld: ld.shed.y      if ld.shed else None,
+
+    # Well (PointObject)
+    "well_x": lambda ld: ld.well.x if ld.well else None,
+    "well_y": lambda ld: ld.well.y if ld.well else None,
+
+    # Septic (PointObject) — attribute name resolved once in _SEPTIC_ATTR
+    "septic_x": lambda ld: s.x if (s := _get_septic(ld)) else None,
+    "septic_y": lambda ld: s.y if (s := _get_septic(ld)) else None,
+}
+
+# Form grid padding, shared by every row/checkbox
+_PADX_LABEL = (0, 10)
+_PADY_CHECK = (0, 4)
+
+# Form section -> (label, key) rows, in display order
+_FORM_ROWS = {
+    "Boundaries": (
+        ("Front Property Line (ft)", "front"),
+        ("Back Property Line (ft)",  "back"),
+        ("Left Property Line (ft)",  "left"),
+        ("Right Property Line (ft)", "right"),
+    ),
+    "House": (
+        ("House Width (left to right) (ft)",             "house_width"),
+        ("House Depth (front to back) (ft)",             "house_height"),
+        ("House distance from left property line (ft)",  "house_x"),
+        ("House distance from front property line (ft)", "house_y"),
+    ),
+    "Shed": (
+        ("Shed Width (left to right) (ft)",             "shed_width"),
+        ("Shed Depth (front to back) (ft)",             "shed_height"),
+        ("Shed distance from left property line (ft)",  "shed_x"),
+        ("Shed distance from front property line (ft)", "shed_y"),
+    ),
+    "Well": (
+        ("Well distance from left property line (ft)",  "well_x"),
+        ("Well distance from front property line (ft)", "well_y"),
+    ),
+    "Septic Tank": (
+        ("Tank distance from left property line (ft)",  "septic_x"),
+        ("Tank distance from front property line (ft)", "septic_y"),
+    ),
+}
+
+# Form font: one named Tk font shared by every dialog, created on first use
+_FORM_FONT = None
+
+def _get_form_font():
+    global _FORM_FONT
+    if _FORM_FONT is None:
+        import tkinter.font as tkfont
+        _FORM_FONT = tkfont.Font(family="Segoe UI", size=14)  # bump to 14 if you want bigger
+        # Form entries pick the font up from the option database at creation,
+        # instead of each one being configured with font=; added once per app
+        root.option_add("*TEntry.font", _FORM_FONT)
+    return _FORM_FONT
+
 # ---------- Create New Layout dialog ----------
 class NewLayoutDialog(tk.Toplevel):
     def __init__(self, parent: tk.Misc, initial: Optional[LayoutData] = None):
         super().__init__(parent)
-        import tkinter.font as tkfont
-        self.form_font = tkfont.Font(family="Segoe UI", size=14)  # bump to 14 if you want bigger
+        # Stay unmapped while the form is built so it is laid out and painted once
+        self.withdraw()
+        self.form_font = _get_form_font()
         self.initial = initial # <- store the layout to pre-fill from
         self.title("Edit Layout" if initial else "Create New Layout")
         self.geometry(APP_DIALOG_SIZE)     # use global constant
         self.minsize(720, 960)
         self.resizable(True, True)
         self.result: Optional[LayoutData] = None
+        # One Tcl validator command shared by every numeric entry in the form
+        self.tk.call("proc", _VALIDATE_PROC, "P", _VALIDATE_BODY)
+        self._vcmd = (_VALIDATE_PROC, "%P")
 
         try:
             # --- Build UI start ---
@@ -344,7 +451,7 @@ class NewLayoutDialog(tk.Toplevel):
             content.columnconfigure(0, weight=0)  # labels
             content.columnconfigure(1, weight=1)  # fields
 
-            self.entries = {}     # label_text -> ttk.Entry
+            self.entries = {}     # stable field key -> ttk.Entry
             self.check_vars = {}  # name -> tk.BooleanVar
             r = 0
 
@@ -353,10 +460,7 @@ class NewLayoutDialog(tk.Toplevel):
                       style="App.Header.TLabel").grid(row=r, column=0, columnspan=2,
                                                       sticky="w", pady=(0, 8))
             r += 1
-            r = self._row(content, r, "Front Property Line (ft)", key="front")
-            r = self._row(content, r, "Back Property Line (ft)",  key="back")
-            r = self._row(content, r, "Left Property Line (ft)",  key="left")
-            r = self._row(content, r, "Right Property Line (ft)", key="right")
+            r = self._rows(content, r, "Boundaries")
             # <--- add vertical spacer row before next section
             ttk.Label(content, text="").grid(row=r, column=0, pady=6)
             r += 1
@@ -370,10 +474,10 @@ class NewLayoutDialog(tk.Toplevel):
                 content,
                 text="Include House",
                 variable=self.check_vars["House"],
-                command=self._toggle_house,     # wires to the toggle method below
+                command=lambda: self._toggle("House"),
                 font=self.form_font
             )
-            house_cb.grid(row=r, column=0, columnspan=2, sticky="w", pady=(0, 4))
+            house_cb.grid(row=r, column=0, columnspan=2, sticky="w", pady=_PADY_CHECK)
             r += 1
 
             # A dedicated frame to hold all "House" inputs
@@ -382,11 +486,7 @@ class NewLayoutDialog(tk.Toplevel):
             self.house_frame.columnconfigure(0, weight=0)  # label col
             self.house_frame.columnconfigure(1, weight=0)  # entry col (lets entries expand)
             # build the House rows *inside* the frame
-            hr = 0
-            hr = self._row(self.house_frame, hr, "House Width (left to right) (ft)", key="house_width")
-            hr = self._row(self.house_frame, hr, "House Depth (front to back) (ft)", key="house_height")
-            hr = self._row(self.house_frame, hr, "House distance from left property line (ft)", key="house_x")
-            hr = self._row(self.house_frame, hr, "House distance from front property line (ft)", key="house_y")
+            self._rows(self.house_frame, 0, "House")
             r += 1
 
             # spacer before Shed
@@ -402,10 +502,10 @@ class NewLayoutDialog(tk.Toplevel):
                 content,
                 text="Include Shed",
                 variable=self.check_vars["Shed"],
-                command=self._toggle_shed,
+                command=lambda: self._toggle("Shed"),
                 font=self.form_font
             )
-            shed_cb.grid(row=r, column=0, columnspan=2, sticky="w", pady=(0, 4))
+            shed_cb.grid(row=r, column=0, columnspan=2, sticky="w", pady=_PADY_CHECK)
             r += 1
 
             # Frame to hold all Shed inputs
@@ -415,11 +515,7 @@ class NewLayoutDialog(tk.Toplevel):
             self.shed_frame.columnconfigure(1, weight=0)  # entry col
 
             # Build Shed rows *inside* the frame
-            sr = 0
-            sr = self._row(self.shed_frame, sr, "Shed Width (left to right) (ft)",        key="shed_width")
-            sr = self._row(self.shed_frame, sr, "Shed Depth (front to back) (ft)",        key="shed_height")
-            sr = self._row(self.shed_frame, sr, "Shed distance from left property line (ft)",  key="shed_x")
-            sr = self._row(self.shed_frame, sr, "Shed distance from front property line (ft)", key="shed_y")
+            self._rows(self.shed_frame, 0, "Shed")
             r += 1  # move to next grid row in 'content'
 
             # spacer before Well
@@ -436,10 +532,10 @@ class NewLayoutDialog(tk.Toplevel):
                 content,
                 text="Include Well",
                 variable=self.check_vars["Well"],
-                command=self._toggle_well,
+                command=lambda: self._toggle("Well"),
                 font=self.form_font
             )
-            well_cb.grid(row=r, column=0, columnspan=2, sticky="w", pady=(0, 4))
+            well_cb.grid(row=r, column=0, columnspan=2, sticky="w", pady=_PADY_CHECK)
             r += 1
 
             # Frame to hold all Well inputs
@@ -449,9 +545,7 @@ class NewLayoutDialog(tk.Toplevel):
             self.well_frame.columnconfigure(1, weight=0)  # entry col
 
             # Build Well rows *inside* the frame
-            wr = 0
-            wr = self._row(self.well_frame, wr, "Well distance from left property line (ft)", key="well_x")
-            wr = self._row(self.well_frame, wr, "Well distance from front property line (ft)", key="well_y")
+            self._rows(self.well_frame, 0, "Well")
             r += 1  # move to next grid row in 'content'
 
             # spacer before Septic
@@ -462,17 +556,17 @@ class NewLayoutDialog(tk.Toplevel):
             
             # ---------- Septic ----------
             self.check_vars["Septic Tank"] = tk.BooleanVar(
-                value=False if self.initial is None else bool(getattr(self.initial, "septic", getattr(self.initial, "septic_tank", None)))
+                value=False if self.initial is None else bool(getattr(self.initial, _SEPTIC_ATTR, None))
             )
 
             septic_cb = tk.Checkbutton(
                 content,
                 text="Include Septic Tank",
                 variable=self.check_vars["Septic Tank"],
-                command=self._toggle_septic,
+                command=lambda: self._toggle("Septic Tank"),
                 font=self.form_font
             )
-            septic_cb.grid(row=r, column=0, columnspan=2, sticky="w", pady=(0, 4))
+            septic_cb.grid(row=r, column=0, columnspan=2, sticky="w", pady=_PADY_CHECK)
             r += 1
 
             # Frame to hold all Septic inputs
@@ -482,9 +576,11 @@ class NewLayoutDialog(tk.Toplevel):
             self.septic_frame.columnconfigure(1, weight=0)  # entry col
 
             # Build Septic rows *inside* the frame
-            pr = 0
-            pr = self._row(self.septic_frame, pr, "Tank distance from left property line (ft)", key="septic_x")
-            pr = self._row(self.septic_frame, pr, "Tank distance from front property line (ft)", key="septic_y")
+            self._rows(self.septic_frame, 0, "Septic Tank")
+
+            # Edit mode: pre-fill every field in one pass once all rows exist
+            if self.initial:
+                self._prefill(self.initial)
             # <--- add vertical spacer row before next section
             ttk.Label(content, text="").grid(row=r, column=0, pady=6)
             r += 1  # move to next grid row in 'content'
@@ -498,11 +594,20 @@ class NewLayoutDialog(tk.Toplevel):
 
             btns.grid(row=r, column=0, columnspan=2, sticky="e", pady=(16, 0))  
 
-            # Initial toggles 
-            self._toggle_house()
-            self._toggle_shed()
-            self._toggle_well()
-            self._toggle_septic()
+            # Checkbox name -> (include var, frame holding that object's inputs)
+            self._sections = {
+                "House":       (self.check_vars["House"],       self.house_frame),
+                "Shed":        (self.check_vars["Shed"],        self.shed_frame),
+                "Well":        (self.check_vars["Well"],        self.well_frame),
+                "Septic Tank": (self.check_vars["Septic Tank"], self.septic_frame),
+            }
+
+            # Initial visibility: frames are gridded as built, so only hide the unchecked ones
+            self._apply_initial_visibility()
+
+            # Single geometry pass for the finished form, then show it
+            self.update_idletasks()
+            self.deiconify()
 
             # Modal
             self.transient(self.master)
@@ -515,113 +620,56 @@ class NewLayoutDialog(tk.Toplevel):
 
         # Wrap the form build in a try/except to surface the real error for debugging
         except Exception as e:
+            self.deiconify()  # don't leave a half-built dialog hidden
             messagebox.showerror("Dialog Error", f"Failed to build form:\n{e}")
             return    
 
     # helpers
-    def _row(self, parent, row, label_text, key=None):
+    def _rows(self, parent, row, section):
+        """Build every entry row listed for `section` in _FORM_ROWS; returns the next row."""
+        for label_text, key in _FORM_ROWS[section]:
+            row = self._row(parent, row, label_text, key)
+        return row
+
+    def _row(self, parent, row, label_text, key):
         # label
         ttk.Label(parent, text=label_text, font=self.form_font).grid(
-            row=row, column=0, sticky="w", padx=(0, 10)
+            row=row, column=0, sticky="w", padx=_PADX_LABEL
         )
-        # allow up to 5 digits, optional decimal point + up to 2 decimals
-        v_re = re.compile(r"^\d{0,5}(\.\d{0,2})?$")
-        vcmd = (self.register(lambda P: (P == "") or bool(v_re.match(P))), "%P")
-
         # short numeric entry: ~5 chars, right aligned, no stretching
         entry = ttk.Entry(
             parent,
-            font=self.form_font,
+            style="App.TEntry",
             width=6,
             justify="right",
             validate="key",
-            validatecommand=vcmd,
+            validatecommand=self._vcmd,
         )
         entry.grid(row=row, column=1, sticky="w")
 
-        # Store by label (for display lookups) and by stable key (for logic)
-        self.entries[label_text] = entry
-        if key:
-            self.entries[key] = entry 
-
-
-        # prefill in Edit mode
-        if key and self.initial:
-            val = self._get_initial_by_key(key, self.initial)
-            if val is not None:
-                entry.insert(0, str(val))
+        # Store by stable key only; labels are display text
+        self.entries[key] = entry
 
         return row + 1
 
-    def _get_initial_by_key(self, key: str, ld: LayoutData):
-        # Boundaries
-        if key == "front":
-            return ld.front
-        if key == "back":
-            return ld.back
-        if key == "left":
-            return ld.left
-        if key == "right":
-            return ld.right
-
-        # House (RectangleObject)
-        if key == "house_width":
-            return ld.house.width if ld.house else None
-        if key == "house_height":
-            return ld.house.height if ld.house else None
-        if key == "house_x":
-            return ld.house.x if ld.house else None
-        if key == "house_y":
-            return ld.house.y if ld.house else None
-
-        # Shed (RectangleObject)
-        if key == "shed_width":
-            return ld.shed.width if ld.shed else None
-        if key == "shed_height":
-            return ld.shed.height if ld.shed else None
-        if key == "shed_x":
-            return ld.shed.x if ld.shed else None
-        if key == "shed_y":
-            return ld.shed.y if ld.shed else None
-
-        # Well (PointObject)
-        if key == "well_x":
-            return ld.well.x if ld.well else None
-        if key == "well_y":
-            return ld.well.y if ld.well else None
-
-        # Septic (RectangleObject) — change attribute name if your LayoutData uses 'septic_tank'
-        septic = getattr(ld, "septic", None)  # or "septic_tank"
-        if key == "septic_x":
-            return septic.x if septic else None
-        if key == "septic_y":
-            return septic.y if septic else None
-
-        return None
-    
-    def _toggle_house(self):
-        if self.check_vars["House"].get():
-            self.house_frame.grid()         # show
-        else:
-            self.house_frame.grid_remove()  #hide
-
-    def _toggle_shed(self):
-        if self.check_vars["Shed"].get():
-            self.shed_frame.grid()         # show
-        else:
-            self.shed_frame.grid_remove()  # hide
+    def _prefill(self, ld: LayoutData):
+        entries = self.entries
+        for key, fn in _KEY_EXTRACTORS.items():
+            val = fn(ld)
+            if val is not None:
+                entries[key].insert(0, str(val))
 
-    def _toggle_well(self):
-        if self.check_vars["Well"].get():
-            self.well_frame.grid()         # show
-        else:
-            self.well_frame.grid_remove()  # hide
+    def _apply_initial_visibility(self):
+        for var, frame in self._sections.values():
+            if not var.get():
+                frame.grid_remove()
 
-    def _toggle_septic(self):
-        if self.check_vars["Septic Tank"].get():
-            self.septic_frame.grid()         # show
+    def _toggle(self, name: str):
+        var, frame = self._sections[name]
+        if var.get():
+            frame.grid()         # show
         else:
-            self.septic_frame.grid_remove()  # hide
+            frame.grid_remove()  # hide
 
     def _cancel(self):
         self.result = None
@@ -629,7 +677,7 @@ class NewLayoutDialog(tk.Toplevel):
 
     def _req(self, name: str) -> float:
         """
-        Fetch a required numeric field by stable key (preferred) or label text.
+        Fetch a required numeric field by its stable key.
         Raises ValueError if empty; KeyError if the field isn't found.
         """
         entry = self.entries.get(name)
@@ -641,48 +689,49 @@ class NewLayoutDialog(tk.Toplevel):
         return float(v)
 
     def _create(self):
+        req, checked = self._req, self.check_vars  # locals for the submit path
         try:
             # Required boundaries
-            front = self._req("front")
-            back  = self._req("back")
-            left  = self._req("left")
-            right = self._req("right")
+            front = req("front")
+            back  = req("back")
+            left  = req("left")
+            right = req("right")
 
             # Optional objects based on checkboxes
             house = None
-            if self.check_vars["House"].get():
+            if checked["House"].get():
                 house = RectangleObject(
                     name="House",
-                    width=self._req("house_width"),
-                    height=self._req("house_height"),
-                    x=self._req("house_x"),
-                    y=self._req("house_y"),
+                    width=req("house_width"),
+                    height=req("house_height"),
+                    x=req("house_x"),
+                    y=req("house_y"),
                 )
 
             shed = None
-            if self.check_vars["Shed"].get():
+            if checked["Shed"].get():
                 shed = RectangleObject(
                     name="Shed",
-                    width=self._req("shed_width"),
-                    height=self._req("shed_height"),
-                    x=self._req("shed_x"),
-                    y=self._req("shed_y"),
+                    width=req("shed_width"),
+                    height=req("shed_height"),
+                    x=req("shed_x"),
+                    y=req("shed_y"),
                 )
 
             well = None
-            if self.check_vars["Well"].get():
+            if checked["Well"].get():
                 well = PointObject(
                     name="Well",
-                    x=self._req("well_x"),
-                    y=self._req("well_y"),
+                    x=req("well_x"),
+                    y=req("well_y"),
                 )
 
             septic = None
-            if self.check_vars["Septic Tank"].get():
+            if checked["Septic Tank"].get():
                 septic = PointObject(
                     name="Septic Tank",
-                    x=self._req("septic_x"),
-                    y=self._req("septic_y"),
+                    x=req("septic_x"),
+                    y=req("septic_y"),
                 )                    
 
             self.result = LayoutData(
@@ -699,7 +748,7 @@ class NewLayoutDialog(tk.Toplevel):
 
 # Accept an optional initial layout to pre-fill the form
 def prompt_for_new_layout(initial: Optional[LayoutData] = None) -> Optional[LayoutData]:
-    root = tk._default_root  # or your main Tk instance
+    # `root` is the module's main Tk instance (created below, before any handler runs)
     dlg = NewLayoutDialog(root, initial=initial)  # pass it into the dialog
     root.wait_window(dlg)
     return dlg.result
@@ -708,6 +757,44 @@ def prompt_for_new_layout(initial: Optional[LayoutData] = None) -> Optional[Layo
 current_file_path: Optional[str] = None
 current_layout_data: Optional[LayoutData] = None
 
+def _show_editor(layout, file_path):
+    """Open the editor window (it raises itself) and block until it is closed."""
+    win = open_editor_window(root, layout, file_path)
+    if win is not None:
+        root.wait_window(win)
+
+# ---------- Background PDF export ----------
+_PDF_POLL_MS = 100
+# One worker: exports run in submission order and never overlap on the same file
+_pdf_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-export")
+
+def _export_pdf_in_background(layout: LayoutData, json_path: str, log_title: str) -> None:
+    """
+    Render the layout's PDF on the export worker so the menu/editor stay responsive.
+    The worker gets a copy, so edits made in the editor meanwhile can't tear the render.
+    Failures are logged from the worker; the warning is shown from the Tk thread.
+    """
+    out_pdf = str(pdf_path_for_layout(json_path))
+
+    def _work(snapshot):
+        try:
+            from print_export import export_to_pdf
+            export_to_pdf(snapshot, out_pdf)
+        except Exception:
+            _write_log(log_title, *sys.exc_info())
+            return False
+        return True
+
+    future = _pdf_pool.submit(_work, copy.deepcopy(layout))
+
+    def _poll():
+        if not future.done():
+            root.after(_PDF_POLL_MS, _poll)
+        elif not future.result():
+            messagebox.showwarning("PDF Export", "Saved layout.json but failed to create PDF." + _SEE_LOG)
+            _open_log_in_notepad()
+    root.after(_PDF_POLL_MS, _poll)
+
 # ---------- Button handlers ----------
 def on_create_new():
     """Create a new layout, save it, export PDF, and open the editor (with logging)."""
@@ -717,10 +804,8 @@ def on_create_new():
     try:
         layout = prompt_for_new_layout()
     except Exception:
-        import sys
-        _write_log("Create New – prompt_for_new_layout error", *sys.exc_info())
-        messagebox.showerror("Create New", f"Problem opening the new-layout dialog.\nSee log at:\n{LOG_PATH}")
-        _open_log_in_notepad()
+        _report_error("Create New – prompt_for_new_layout error",
+                      "Create New", "Problem opening the new-layout dialog.")
         return
 
     if layout is None:
@@ -730,15 +815,13 @@ def on_create_new():
     try:
         path = filedialog.asksaveasfilename(
             title="Save New Layout",
-            initialdir=str(get_layouts_dir()),
+            initialdir=get_layouts_dir_str(),
             defaultextension=".json",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
     except Exception:
-        import sys
-        _write_log("Create New – asksaveasfilename error", *sys.exc_info())
-        messagebox.showerror("Create New", f"Problem opening the Save dialog.\nSee log at:\n{LOG_PATH}")
-        _open_log_in_notepad()
+        _report_error("Create New – asksaveasfilename error",
+                      "Create New", "Problem opening the Save dialog.")
         return
 
     if not path:
@@ -746,76 +829,40 @@ def on_create_new():
 
     # 3) Save JSON + update app state
     try:
+        from file_handler import save_layout_to_file
         save_layout_to_file(layout, path)  # write JSON to disk
     except Exception:
-        import sys
-        _write_log("Create New – save_layout_to_file error", *sys.exc_info())
-        messagebox.showerror("Save Error", f"Failed to save layout.\nSee log at:\n{LOG_PATH}")
-        _open_log_in_notepad()
+        _report_error("Create New – save_layout_to_file error",
+                      "Save Error", "Failed to save layout.")
         return
 
     current_layout_data = layout
     current_file_path = path
 
-    # 4) Auto-generate PDF (non-fatal if it fails)
-    try:
-        out_pdf = pdf_path_for_layout(current_file_path)
-        export_to_pdf(current_layout_data, str(out_pdf))  # adjust if your signature differs
-    except Exception:
-        import sys
-        _write_log("Create New – PDF export error", *sys.exc_info())
-        messagebox.showwarning(
-            "PDF Export",
-            f"Saved layout.json but failed to create PDF.\nSee log at:\n{LOG_PATH}"
-        )
-        _open_log_in_notepad()
+    # 4) Auto-generate PDF in the background (non-fatal if it fails)
+    _export_pdf_in_background(current_layout_data, current_file_path,
+                              "Create New – PDF export error")
 
     # 5) Open the editor window
     try:
-        win = open_editor_window(root, current_layout_data, current_file_path)
-        if win is None:
-            return
-        win.update()
-        win.deiconify()
-        win.lift()
-        win.focus_force()
-        root.wait_window(win)
+        _show_editor(current_layout_data, current_file_path)
     except Exception:
-        import sys
-        _write_log("Create New – editor window error", *sys.exc_info())
-        messagebox.showerror("Editor", f"Could not open the editor window.\nSee log at:\n{LOG_PATH}")
-        _open_log_in_notepad()
+        _report_error("Create New – editor window error",
+                      "Editor", "Could not open the editor window.")
 def on_open_existing():
     global current_layout_data, current_file_path
     path = filedialog.askopenfilename(
         title="Open layout JSON",
-        initialdir=str(get_layouts_dir()),
+        initialdir=get_layouts_dir_str(),
         filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
     )
     if not path:
         return
 
     try:
-        result = load_layout_from_file(path)
-        # Handle both return styles: (layout, path) or just layout
-        if isinstance(result, tuple) and len(result) == 2:
-            current_layout_data, current_file_path = result
-        else:
-            current_layout_data = result
-            current_file_path = path
-        win = open_editor_window(root, current_layout_data, current_file_path)
-        if win is None:
-            return
-
-        try:
-            win.update()
-            win.deiconify()
-            win.lift()
-            win.focus_force()
-        except Exception:
-            pass
-
-        root.wait_window(win)
+        from file_handler import load_layout_from_file
+        current_layout_data, current_file_path = load_layout_from_file(path)
+        _show_editor(current_layout_data, current_file_path)
 
     except Exception as e:
         messagebox.showerror("Load Error", f"Failed to load layout:\n{e}")
@@ -826,24 +873,26 @@ def on_edit_layout():
     # Always ask the user to pick a file to edit
     path = filedialog.askopenfilename(
         title="Choose a layout to edit",
-        initialdir=str(get_layouts_dir()),
+        initialdir=get_layouts_dir_str(),
         filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
     )
     if not path:
         return  # user cancelled
 
-    # Load the chosen file
+    # Load the chosen file. Re-editing the file we already have open reuses the
+    # layout in memory: the editor's saves are debounced onto a worker, but
+    # LayoutCanvas.destroy() flushes the pending save and waits for it, so by
+    # the time the editor has closed the file on disk matches memory
     try:
-        result = load_layout_from_file(path)
-        if isinstance(result, tuple) and len(result) == 2:
-            layout, file_path = result
+        if current_layout_data is not None and current_file_path and \
+                os.path.normcase(os.path.abspath(path)) == os.path.normcase(os.path.abspath(current_file_path)):
+            layout, file_path = current_layout_data, current_file_path
         else:
-            layout, file_path = result, path
+            from file_handler import load_layout_from_file
+            layout, file_path = load_layout_from_file(path)
     except Exception:
-        import sys
-        _write_log("Load Error in on_edit_layout", *sys.exc_info())
-        messagebox.showerror("Load Error", f"Failed to load layout.\nSee log at:\n{LOG_PATH}")
-        _open_log_in_notepad()
+        _report_error("Load Error in on_edit_layout",
+                      "Load Error", "Failed to load layout.")
         return
 
     # Open the same form, pre-filled with the chosen layout
@@ -853,62 +902,42 @@ def on_edit_layout():
 
     # Save changes back to the chosen file
     try:
+        from file_handler import save_layout_to_file
         save_layout_to_file(updated, file_path)
     except Exception:
-        import sys
-        _write_log("Save Error in on_edit_layout", *sys.exc_info())
-        messagebox.showerror("Save Error", f"Failed to save layout.\nSee log at:\n{LOG_PATH}")
-        _open_log_in_notepad()
+        _report_error("Save Error in on_edit_layout",
+                      "Save Error", "Failed to save layout.")
         return
 
     # Update app state
     current_layout_data = updated
     current_file_path = file_path
 
-    # --- Auto-generate PDF into print/ ---
-    try:
-        out_pdf = pdf_path_for_layout(current_file_path)
-        export_to_pdf(current_layout_data, str(out_pdf))
-    except Exception:
-        import sys
-        _write_log("PDF Export Error in on_edit_layout", *sys.exc_info())
-        messagebox.showwarning("PDF Export",
-                               f"Saved layout.json but failed to create PDF.\nSee log at:\n{LOG_PATH}")
-        _open_log_in_notepad()
+    # --- Auto-generate PDF into print/ (background) ---
+    _export_pdf_in_background(current_layout_data, current_file_path,
+                              "PDF Export Error in on_edit_layout")
 
     # Open the editor window with the updated data
-    win = open_editor_window(root, current_layout_data, current_file_path)
-    if win is None:
-        return
-
-    try:
-        win.update()
-        win.deiconify()
-        win.lift()
-        win.focus_force()
-    except Exception:
-        import sys
-        _write_log("Editor Window Error in on_edit_layout", *sys.exc_info())
-        _open_log_in_notepad()
+    _show_editor(current_layout_data, current_file_path)
 
-    root.wait_window(win)
 def open_pdf(path: str) -> None:
+    # Fire and forget: don't block the Tk loop while the viewer starts
     try:
         if os.name == "nt":                 # Windows
-            os.startfile(path)
-        elif sys.platform == "darwin":      # macOS
-            subprocess.run(["open", path], check=False)
-        else:                               # Linux
-            subprocess.run(["xdg-open", path], check=False)
+            os.startfile(path, "open")
+        else:
+            opener = "open" if sys.platform == "darwin" else "xdg-open"  # macOS / Linux
+            subprocess.Popen([opener, path], stdin=subprocess.DEVNULL,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     except Exception as e:
         messagebox.showerror("Open PDF", f"Could not open PDF:\n{e}")
 
 def on_print_pdf():
     # always show the picker; don’t require a loaded layout
-    ensure_app_dirs()  # makes 'print/' if missing
+    # (print/ is created once at startup by ensure_app_dirs)
     path = filedialog.askopenfilename(
         title="Choose a PDF to view/print",
-        initialdir=str(get_prints_dir()),
+        initialdir=get_prints_dir_str(),
         filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
     )
     if not path:
@@ -938,18 +967,22 @@ apply_ttk_styles(root)  # apply shared fonts/styles once
 root.title(f"Scale Drawing Menu v{APP_VERSION}")
 root.geometry("400x420")
 root.resizable(False, False)
-try:
-    root.iconbitmap(ICON_PATH)
-except Exception:
-    pass
+if ICON_PATH:
+    try:
+        root.iconbitmap(ICON_PATH)
+    except Exception:
+        pass
 
 MENU_FONT_BTN = APP_FONT_BASE
 
 ttk.Label(root, text="🧰 Scale Drawing Program", style="App.Header.TLabel").pack(pady=20)
-tk.Button(root, text="🆕  Create New Layout",    width=32, font=MENU_FONT_BTN, command=on_create_new).pack(pady=6)
-tk.Button(root, text="📂  Open Existing Layout", width=32, font=MENU_FONT_BTN, command=on_open_existing).pack(pady=6)
-tk.Button(root, text="✏️  Edit Layout",          width=32, font=MENU_FONT_BTN, command=on_edit_layout).pack(pady=6)
-tk.Button(root, text="🖨️  Print PDF",            width=32, font=MENU_FONT_BTN, command=on_print_pdf).pack(pady=6)
-tk.Button(root, text="❌  Exit",                  width=32, font=MENU_FONT_BTN, command=on_exit).pack(pady=18)
+for text, cmd, pady in (
+    ("🆕  Create New Layout",    on_create_new,    6),
+    ("📂  Open Existing Layout", on_open_existing, 6),
+    ("✏️  Edit Layout",          on_edit_layout,   6),
+    ("🖨️  Print PDF",            on_print_pdf,     6),
+    ("❌  Exit",                  on_exit,          18),
+):
+    tk.Button(root, text=text, width=32, font=MENU_FONT_BTN, command=cmd).pack(pady=pady)
 
 root.mainloop()
@@ -6,20 +6,66 @@ a scale yard layout. Supports rendering of boundaries and objects with drag-and-
 and object rotation features.
 """
 
+import functools
+import logging
+import math
+import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from layout_data import LayoutData, RectangleObject, PointObject
 from file_handler import save_layout_to_file
 from typing import cast, Union
 from typing import Optional
 from ui_palette import HEX, role_for
-COLOR_DEBUG = False  # turn to false when done testing
-if COLOR_DEBUG:
+
+log = logging.getLogger(__name__)
+COLOR_DEBUG = False  # set True to log object colors (ignored under python -O)
+if __debug__ and COLOR_DEBUG:
     print(f"[COLOR DEBUG] HEX keys = {list(HEX.keys())}")
 
 # Grid and zoom configuration
 GRID_SPACING_FT = 10
+GRID_LINE_FILL = "#eeeeee"
+
+# Canvas layers, bottom to top. Every item carries one of these tags and
+# _restack() puts the layers back in this order after one is rebuilt.
+LAYER_ORDER = ("grid", "guide_line", "object", "guide_label", "guide_objdist")
 ZOOM = 1.2  # Zoom factor for scaling the layout to fit
 MARGIN_PX = 20  # Padding space on top and left for axis labels
+GUIDE_REDRAW_MS = 33  # live guide redraws while dragging are capped at ~30 fps
+MOTION_MIN_MS = 16  # drag motion is applied at most ~60 times a second
+GUIDE_CELL_PX = 4  # live guides only redraw once the dragged object crosses into a new cell
+SAVE_DEBOUNCE_MS = 250  # drops within this window are written to disk once
+
+# One worker keeps layout writes in order and off the Tk thread
+_save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="layout-save")
+
+# Distance guide styling, shared by every guide item instead of rebuilt per call
+GUIDE_LINE_FILL = "#BFBFBF"
+GUIDE_DASH = (4, 3)
+GUIDE_TEXT_FILL = "#666666"
+GUIDE_FONT = ("TkDefaultFont", 8)
+GUIDE_MIN_PX = 1.5  # guide segments shorter than this get no label
+OBJDIST_FONT = ("Arial", 10, "bold")
+
+
+def _cents(feet: float) -> int:
+    """Feet -> whole hundredths of a foot, rounding half away from zero."""
+    return int(feet * 100 + (0.5 if feet >= 0 else -0.5))
+
+
+@functools.lru_cache(maxsize=64)
+def _object_style(name: Optional[str]) -> tuple[str, str, Optional[str], tuple, str]:
+    """Object name -> (lowercase name, canvas tag, palette role, role tags, fill),
+    worked out (and, with COLOR_DEBUG, logged) once per name."""
+    name_l = (name or "").lower()
+    role = role_for(name)
+    role_tags = (role,) if role else tuple()
+    fill_color = HEX.get(role or name_l, "gray")
+    if __debug__ and COLOR_DEBUG:
+        print(f"[COLOR DEBUG] name='{name}' role='{role}' fill={fill_color}")
+    return name_l, name_l.replace(" ", "_"), role, role_tags, fill_color
+
 
 class LayoutCanvas(tk.Frame):
     def __init__(self, master, layout: LayoutData, filename: str):
@@ -39,6 +85,10 @@ class LayoutCanvas(tk.Frame):
         self.canvas_height = int(total_height_ft * self.feet_to_pixel_ratio)
 
         self.layout = layout
+        # Property size in feet, read by every coordinate conversion; refreshed
+        # by update_canvas_dimensions() rather than looked up on the layout each time
+        self._front_ft = float(layout.front)
+        self._left_ft = float(layout.left)
         self.drag_data = {"tag": None, "offset_x": 0, "offset_y": 0, "start_x": 0, "start_y": 0}
 
         self.canvas = tk.Canvas(
@@ -53,14 +103,42 @@ class LayoutCanvas(tk.Frame):
         self.legend.pack(side="right", fill="y")
 
         # === Distance guides state ===
-        self.show_distance_guides = getattr(self, "show_distance_guides", False)
+        self.show_distance_guides = False              # turned on right after first draw
+        self.show_object_distances = True              # colored shed→object guides
         self.px_per_ft = self.feet_to_pixel_ratio      # reuse your existing scale
         self.live_guide_updates = False                # OFF by default
-        self._guide_redraw_job = None                  # throttle handle
+        self._guide_redraw_job: Optional[str] = None   # throttle handle
+        self._last_guide_redraw = 0.0                  # time.monotonic() of last redraw
+        self._last_guide_key = None                    # geometry the current guides show
+        self._objdist_key = None                       # geometry the colored guides show
+        self._objdist_items: dict[str, tuple[int, int]] = {}  # role -> (line, label)
+        self._guide_items = None                       # (h line, v line, 4 labels), made on first draw
+        self._save_job = None                          # pending debounced save
+        self._last_motion_ts = 0.0                     # time.monotonic() of last applied motion
+        self._pending_motion = None                    # newest skipped (x, y) motion
+        self._motion_job = None                        # trailing flush for _pending_motion
+        self._save_future = None                       # last save handed to _save_pool
+        # Role tag -> the layout object it drags (looked up live, so edits to
+        # self.layout are always seen)
+        self._tag_to_obj_getter = {
+            "house": lambda: self.layout.house,
+            "shed": lambda: self.layout.shed,
+            "well": lambda: self.layout.well,
+            "septic": lambda: self.layout.septic,
+        }
+
+        # Grid + boundary only change with zoom / canvas size; rebuild them only then
+        self._grid_dirty = True
+        self._grid_photo = None  # off-screen image holding the grid lines
+        self._axis_labels: dict[tuple[str, int], int] = {}  # ("x"|"y", ft) -> text item
+        self._boundary_id = None
+        # Object canvas items are created once and then moved with coords();
+        # object tag -> {"body": id, "label": id[, "rotate": id]}
+        self._obj_items: dict[str, dict[str, int]] = {}
 
         self.draw_grid()
         self.draw_objects()
-        self.draw_legend()
+        self.draw_legend()  # static; drawn once here, never by draw_objects
         # draw distance guides
         self.after(0, lambda: self.set_show_distance_guides(True))
         self.on_layout_changed = None  # callback hook set by the window
@@ -68,6 +146,8 @@ class LayoutCanvas(tk.Frame):
         self.canvas.tag_bind("draggable", "<ButtonPress-1>", self.on_drag_start)
         self.canvas.tag_bind("draggable", "<B1-Motion>", self.on_drag_move)
         self.canvas.tag_bind("draggable", "<ButtonRelease-1>", self.on_drag_release)
+        # Tag bindings apply to every item carrying the tag, including ones created later
+        self.canvas.tag_bind("rotate_shed", "<Button-1>", self.rotate_shed_by_click)
         master.bind("r", self.rotate_shed)
         master.bind("+", self.zoom_in)
         master.bind("-", self.zoom_out)
@@ -83,32 +163,70 @@ class LayoutCanvas(tk.Frame):
         return 0.0 if px_per_ft == 0 else (px / px_per_ft)
     
     def draw_grid(self):
-        spacing_ft = GRID_SPACING_FT
-        total_width_ft = self.layout.front
-        total_height_ft = self.layout.left
-
-        for ft in range(0, int(total_width_ft) + 1, spacing_ft):
-            x = self.feet_to_pixels(ft) + MARGIN_PX
-            self.canvas.create_line(x, MARGIN_PX, x, self.canvas_height + MARGIN_PX, fill="#eee")
-            self.canvas.create_text(x, MARGIN_PX - 14, text=str(ft), anchor="n", fill="#444", font=("Arial", 8))
+        """(Re)build the static grid layer (tag "grid") if it's been invalidated."""
+        if not self._grid_dirty:
+            return
+        self.canvas.delete("grid_image")
 
-        for ft in range(0, int(total_height_ft) + 1, spacing_ft):
-            y = self.feet_to_pixels(ft) + MARGIN_PX
-            self.canvas.create_line(MARGIN_PX, y, self.canvas_width + MARGIN_PX, y, fill="#eee")
-            self.canvas.create_text(MARGIN_PX - 14, y, text=str(ft), anchor="w", fill="#444", font=("Arial", 8))
+        spacing_ft = GRID_SPACING_FT
+        total_width_ft = self._front_ft
+        total_height_ft = self._left_ft
+        top, bottom = MARGIN_PX, self.canvas_height + MARGIN_PX
+        left, right = MARGIN_PX, self.canvas_width + MARGIN_PX
+
+        r = self.feet_to_pixel_ratio
+        x_fts = range(0, int(total_width_ft) + 1, spacing_ft)
+        y_fts = range(0, int(total_height_ft) + 1, spacing_ft)
+        xs = [ft * r + MARGIN_PX for ft in x_fts]
+        ys = [ft * r + MARGIN_PX for ft in y_fts]
+
+        # Grid lines are painted into one off-screen image and shown as a single
+        # canvas item; the image is only re-rendered when the grid is invalidated
+        # (zoom / resize). Unpainted pixels stay transparent over the canvas bg.
+        photo = tk.PhotoImage(master=self.canvas, width=right + 1, height=bottom + 1)
+        for x in xs:
+            x = round(x)
+            photo.put(GRID_LINE_FILL, to=(x, top, x + 1, bottom + 1))
+        for y in ys:
+            y = round(y)
+            photo.put(GRID_LINE_FILL, to=(left, y, right + 1, y + 1))
+        self._grid_photo = photo  # Tk drops images that Python stops referencing
+        image_id = self.canvas.create_image(0, 0, anchor="nw", image=photo, tags=("grid", "grid_image"))
+        self.canvas.tag_lower(image_id)  # under the labels + boundary once restacked
+
+        # Axis labels keep their items (text never changes); a rebuild only
+        # moves them, creating or dropping labels if the property size changed
+        wanted = {("x", ft): (x, MARGIN_PX - 14) for ft, x in zip(x_fts, xs)}
+        wanted.update({("y", ft): (MARGIN_PX - 14, y) for ft, y in zip(y_fts, ys)})
+        labels = self._axis_labels
+        for key in labels.keys() - wanted.keys():
+            self.canvas.delete(labels.pop(key))
+        for key, (lx, ly) in wanted.items():
+            if key in labels:
+                self.canvas.coords(labels[key], lx, ly)
+            else:
+                labels[key] = self.canvas.create_text(
+                    lx, ly, text=str(key[1]), anchor="n" if key[0] == "x" else "w",
+                    fill="#444", font=("Arial", 8), tags=("grid",)
+                )
 
         # Draw a visible boundary rectangle for the property
         prop_left_px   = MARGIN_PX
         prop_top_px    = MARGIN_PX
-        prop_right_px  = MARGIN_PX + self.feet_to_pixels(self.layout.front)  # X spans "front" feet
-        prop_bottom_px = MARGIN_PX + self.feet_to_pixels(self.layout.left)   # Y spans "left" feet (your height)
-
-        prop_rect_id = self.canvas.create_rectangle(
-            prop_left_px, prop_top_px, prop_right_px, prop_bottom_px,
-            outline="black", width=2, fill="",
-            tags=("property", "boundary")
-        )
-        self.canvas.tag_lower(prop_rect_id)  # keep it behind objects
+        prop_right_px  = MARGIN_PX + self._front_ft * r  # X spans "front" feet
+        prop_bottom_px = MARGIN_PX + self._left_ft * r   # Y spans "left" feet (your height)
+
+        if self._boundary_id is None:
+            self._boundary_id = self.canvas.create_rectangle(
+                prop_left_px, prop_top_px, prop_right_px, prop_bottom_px,
+                outline="black", width=2, fill="",
+                tags=("property", "boundary", "grid")
+            )
+        else:
+            self.canvas.coords(self._boundary_id, prop_left_px, prop_top_px, prop_right_px, prop_bottom_px)
+        # A rebuilt grid must sit below objects that were drawn before it
+        self._restack()
+        self._grid_dirty = False
     
 
         # Uncomment the following code to display "Left" "Right" "Front" "Back" labels on the LayoutCanvas for debugging
@@ -117,101 +235,115 @@ class LayoutCanvas(tk.Frame):
         #self.canvas.create_text(MARGIN_PX / 2, self.canvas_height / 2, text="Left", fill="red", font=("Arial", 10, "bold"), angle=90)
         #self.canvas.create_text(self.canvas_width + MARGIN_PX - 4, self.canvas_height / 2, text="Right", fill="red", font=("Arial", 10, "bold"), angle=270)
 
+    def _restack(self):
+        """Re-apply LAYER_ORDER; each raise keeps the order within its layer."""
+        for layer in LAYER_ORDER:
+            self.canvas.tag_raise(layer)
+
     def draw_objects(self):
-        self.canvas.delete("all")
+        # Grid persists and objects are updated in place; only guides are rebuilt
+        self._last_guide_key = None
         self.draw_grid()
-        self.draw_legend()
 
-        # Draw all objects using the unified palette
-        self._draw_rect(self.layout.house)
-        self._draw_rect(self.layout.shed)
-        self._draw_point(self.layout.well)
-        self._draw_point(self.layout.septic)
+        # Draw all objects using the unified palette; px = ft * r + MARGIN_PX,
+        # with y flipped against the property depth (layout.left)
+        r = self.feet_to_pixel_ratio
+        left_ft = self._left_ft
+        drawn = {
+            self._draw_rect(self.layout.house, r, left_ft),
+            self._draw_rect(self.layout.shed, r, left_ft),
+            self._draw_point(self.layout.well, r, left_ft),
+            self._draw_point(self.layout.septic, r, left_ft),
+        }
+        # Drop items for objects that are no longer in the layout
+        for tag in self._obj_items.keys() - drawn:
+            self.canvas.delete(*self._obj_items.pop(tag).values())
 
-        # Refresh guides after everything is drawn
+        # Refresh guides (incl. the colored object-to-object ones) after everything is drawn
         self.redraw_distance_guides()
 
-        # NEW: object-to-object guides (colored)
-        self._draw_shed_object_distances()
-
-    def _draw_rect(self, obj: Optional[RectangleObject]):
+    def _draw_rect(self, obj: Optional[RectangleObject], r: float, left_ft: float) -> Optional[str]:
+        """Create or reposition a rectangle object's items; returns its tag.
+        r is the px/ft ratio and left_ft the property depth, hoisted by the caller."""
         if obj is None or obj.x is None or obj.y is None:
-            return
+            return None
 
-        width = obj.width
-        height = obj.height
-        x1 = self.feet_to_pixels(obj.x) + MARGIN_PX
-        y1 = self.feet_to_pixels(self.layout.left - obj.y - obj.height) + MARGIN_PX
-        x2 = x1 + self.feet_to_pixels(width)
-        y2 = y1 + self.feet_to_pixels(height)
-
-        name_l = (obj.name or "").lower()
-        tag = name_l.replace(" ", "_")
-
-        # role tag for selection/rules
-        role = role_for(obj.name)
-        role_tags = (role,) if role else tuple()
-
-        fill_color = HEX.get(role or name_l, "gray")
-        if COLOR_DEBUG:
-            print(f"[COLOR DEBUG] RECT name='{obj.name}' role='{role}' fill={fill_color}")
-        # rectangle + label
-        self.canvas.create_rectangle(
+        ox, oy, ow, oh = obj.x, obj.y, obj.width, obj.height
+        x1 = ox * r + MARGIN_PX
+        y1 = (left_ft - oy - oh) * r + MARGIN_PX
+        x2 = x1 + ow * r
+        y2 = y1 + oh * r
+
+        name_l, tag, role, role_tags, fill_color = _object_style(obj.name)
+
+        items = self._obj_items.get(tag)
+        if items is not None:
+            canvas = self.canvas
+            cx = (x1 + x2) / 2
+            canvas.coords(items["body"], x1, y1, x2, y2)
+            canvas.coords(items["label"], cx, (y1 + y2) / 2)
+            if "rotate" in items:
+                canvas.coords(items["rotate"], cx, y1 - 15)
+            return tag
+
+        # rectangle + label (role tag is for selection/rules)
+        items = self._obj_items[tag] = {}
+        items["body"] = self.canvas.create_rectangle(
             x1, y1, x2, y2,
             fill=fill_color,
-            tags=("draggable", tag) + role_tags
+            tags=("draggable", "object", tag) + role_tags
         )
-        self.canvas.create_text(
+        items["label"] = self.canvas.create_text(
             (x1 + x2) / 2, (y1 + y2) / 2,
             text=obj.name,
             fill="white",
-            tags=("draggable", tag) + role_tags
+            tags=("draggable", "object", tag) + role_tags
         )
 
         if name_l == "shed":
             cx = (x1 + x2) / 2
             cy = y1 - 15
-            self.canvas.create_text(
+            items["rotate"] = self.canvas.create_text(
                 cx, cy,
                 text="↻",
                 fill="blue",
                 font=("Arial", 14, "bold"),
-                tags=("draggable", tag, "rotate_shed") + role_tags
+                tags=("draggable", "object", tag, "rotate_shed") + role_tags
             )
-            self.canvas.tag_bind("rotate_shed", "<Button-1>", self.rotate_shed_by_click)
+        return tag
 
-    def _draw_point(self, obj: Optional[PointObject]):
+    def _draw_point(self, obj: Optional[PointObject], r: float, left_ft: float) -> Optional[str]:
+        """Create or reposition a point object's items; returns its tag.
+        r is the px/ft ratio and left_ft the property depth, hoisted by the caller."""
         if obj is None or obj.x is None or obj.y is None:
-            return
-
-        x = self.feet_to_pixels(obj.x) + MARGIN_PX
-        y = self.feet_to_pixels(self.layout.left - obj.y) + MARGIN_PX
-        r = 6
+            return None
 
-        name_l = (obj.name or "").lower()
-        tag = name_l.replace(" ", "_")
+        x = obj.x * r + MARGIN_PX
+        y = (left_ft - obj.y) * r + MARGIN_PX
+        rad = 6
 
-        role = role_for(obj.name)
-        role_tags = (role,) if role else tuple()
+        name_l, tag, role, role_tags, fill_color = _object_style(obj.name)
 
-        fill_color = HEX.get(role or name_l, "gray")
-        if COLOR_DEBUG:
-            print(f"[COLOR DEBUG] POINT name='{obj.name}' role='{role}' fill={fill_color}")
+        items = self._obj_items.get(tag)
+        if items is not None:
+            canvas = self.canvas
+            canvas.coords(items["body"], x - rad, y - rad, x + rad, y + rad)
+            canvas.coords(items["label"], x, y - 10)
+            return tag
 
-        self.canvas.create_oval(
-            x - r, y - r, x + r, y + r,
+        items = self._obj_items[tag] = {}
+        items["body"] = self.canvas.create_oval(
+            x - rad, y - rad, x + rad, y + rad,
             fill=fill_color,
-            tags=("draggable", tag) + role_tags
+            tags=("draggable", "object", tag) + role_tags
         )
-        self.canvas.create_text(
+        items["label"] = self.canvas.create_text(
             x, y - 10,
             text=obj.name,
             fill="black",
-            tags=("draggable", tag) + role_tags
+            tags=("draggable", "object", tag) + role_tags
         )
- 
-        # Refresh guides after everything is drawn
-        self.redraw_distance_guides()
+        return tag
 
     # --- Distance helpers (feet, top-based Y like our canvas drawing) ---
 
@@ -219,8 +351,8 @@ class LayoutCanvas(tk.Frame):
         """Return (L,T,R,B) in feet for a rectangle object using top-based Y."""
         L = obj.x
         R = obj.x + obj.width
-        T = self.layout.left - (obj.y + obj.height)
-        B = self.layout.left - obj.y
+        T = self._left_ft - (obj.y + obj.height)
+        B = self._left_ft - obj.y
         return L, T, R, B
 
     def _nearest_rect_point_ft(self, rect, px, py):
@@ -270,70 +402,101 @@ class LayoutCanvas(tk.Frame):
 
     def _ft_to_px(self, x_ft, y_ft):
         """Feet (top-based) -> canvas pixels (origin top-left of yard)."""
-        return (
-            self.feet_to_pixels(x_ft) + MARGIN_PX,
-            self.feet_to_pixels(y_ft) + MARGIN_PX
-        )
+        r = self.feet_to_pixel_ratio
+        return (x_ft * r + MARGIN_PX, y_ft * r + MARGIN_PX)
 
-    def _draw_obj_distance_line(self, x1_ft, y1_ft, x2_ft, y2_ft, color_hex, label):
-        """Draw a colored line + label between two ft points (top-based)."""
+    def _draw_obj_distance_line(self, role, x1_ft, y1_ft, x2_ft, y2_ft, label):
+        """Place the colored line + label for role between two ft points (top-based).
+        The pair is created on first use and only moved/relabelled afterwards."""
         x1, y1 = self._ft_to_px(x1_ft, y1_ft)
         x2, y2 = self._ft_to_px(x2_ft, y2_ft)
-        # line
-        self.canvas.create_line(x1, y1, x2, y2, fill=color_hex, width=2, tags=("guide_objdist",))
         # label at midpoint, slightly offset
         mx, my = (x1 + x2) / 2, (y1 + y2) / 2
-        self.canvas.create_text(mx, my - 10, text=label, fill=color_hex, font=("Arial", 10, "bold"),
-                                tags=("guide_objdist",))
+        items = self._objdist_items.get(role)
+        if items is None:
+            color_hex = HEX[role]
+            self._objdist_items[role] = (
+                self.canvas.create_line(x1, y1, x2, y2, fill=color_hex, width=2, tags=("guide_objdist",)),
+                self.canvas.create_text(mx, my - 10, text=label, fill=color_hex, font=OBJDIST_FONT,
+                                        tags=("guide_objdist",)),
+            )
+            return
+        line_id, label_id = items
+        self.canvas.coords(line_id, x1, y1, x2, y2)
+        self.canvas.coords(label_id, mx, my - 10)
+        self.canvas.itemconfigure(label_id, text=label)
+        self.canvas.itemconfigure(line_id, state="normal")
+        self.canvas.itemconfigure(label_id, state="normal")
+
+    def _clear_shed_object_distances(self):
+        self.canvas.itemconfigure("guide_objdist", state="hidden")
+        self._objdist_key = None
 
     def _draw_shed_object_distances(self):
         """Draw colored distances from Shed to Well, Septic, House."""
-        shed = getattr(self.layout, "shed", None)
-        if not shed or shed.x is None:
+        # Skip everything if none of the four objects (or the scale) changed
+        L = self.layout
+        shed, well, septic, house = L.shed, L.well, L.septic, L.house
+        left_ft = self._left_ft
+        key = (self.feet_to_pixel_ratio, left_ft,
+               *((o.x, o.y, getattr(o, "width", None), getattr(o, "height", None)) if o else None
+                 for o in (shed, well, septic, house)))
+        if key == self._objdist_key:
             return
+        # Hide all three; the ones that can be measured are re-shown below
+        self._clear_shed_object_distances()
+        self._objdist_key = key
 
-        # Colors
-        col_house  = HEX["house"]
-        col_well   = HEX["well"]
-        col_septic = HEX["septic"]
+        if not shed or shed.x is None:
+            return
 
         # Rect for shed
-        sL, sT, sR, sB = self._rect_ft(shed)
+        shed_rect = self._rect_ft(shed)
 
         # Shed <-> Well (point)
-        well = getattr(self.layout, "well", None)
         if well and well.x is not None:
             wx = well.x
-            wy = self.layout.left - well.y  # point Y in top-based feet
-            qx, qy, px, py = self._nearest_rect_point_ft((sL, sT, sR, sB), wx, wy)
-            dist = ((qx - px) ** 2 + (qy - py) ** 2) ** 0.5
-            self._draw_obj_distance_line(qx, qy, px, py, col_well, f"{dist:.1f} ft")
+            wy = left_ft - well.y  # point Y in top-based feet
+            qx, qy, px, py = self._nearest_rect_point_ft(shed_rect, wx, wy)
+            dist = math.hypot(qx - px, qy - py)
+            self._draw_obj_distance_line("well", qx, qy, px, py, f"{dist:.1f} ft")
 
         # Shed <-> Septic (point)
-        septic = getattr(self.layout, "septic", None)
         if septic and septic.x is not None:
             sx = septic.x
-            sy = self.layout.left - septic.y
-            qx, qy, px, py = self._nearest_rect_point_ft((sL, sT, sR, sB), sx, sy)
-            dist = ((qx - px) ** 2 + (qy - py) ** 2) ** 0.5
-            self._draw_obj_distance_line(qx, qy, px, py, col_septic, f"{dist:.1f} ft")
+            sy = left_ft - septic.y
+            qx, qy, px, py = self._nearest_rect_point_ft(shed_rect, sx, sy)
+            dist = math.hypot(qx - px, qy - py)
+            self._draw_obj_distance_line("septic", qx, qy, px, py, f"{dist:.1f} ft")
 
         # Shed <-> House (rect)
-        house = getattr(self.layout, "house", None)
         if house and house.x is not None:
-            hL, hT, hR, hB = self._rect_ft(house)
-            ax, ay, bx, by = self._nearest_rect_rect_ft((sL, sT, sR, sB), (hL, hT, hR, hB))
-            dist = ((ax - bx) ** 2 + (ay - by) ** 2) ** 0.5
-            self._draw_obj_distance_line(ax, ay, bx, by, col_house, f"{dist:.1f} ft")
+            ax, ay, bx, by = self._nearest_rect_rect_ft(shed_rect, self._rect_ft(house))
+            dist = math.hypot(ax - bx, ay - by)
+            self._draw_obj_distance_line("house", ax, ay, bx, by, f"{dist:.1f} ft")
 
     # schedule a guides redraw on the next Tk tick (coalesces rapid drags)
     def request_guide_redraw(self):
         """Coalesce rapid drags into a single guide redraw on next Tk tick."""
-        job = getattr(self, "_guide_redraw_job", None)
-        if job:
-            self.after_cancel(job)
+        if self._guide_redraw_job:
+            self.after_cancel(self._guide_redraw_job)
             self._guide_redraw_job = None
-        self._guide_redraw_job = self.after(0, self.redraw_distance_guides)    
+        self._guide_redraw_job = self.after(0, self._run_queued_guide_redraw)
+
+    def _throttled_guide_redraw(self):
+        """Leading-edge throttle: redraw now if the last redraw is old enough,
+        otherwise queue one trailing redraw for the end of the window."""
+        if self._guide_redraw_job:
+            return  # a redraw is already queued
+        wait_ms = GUIDE_REDRAW_MS - (time.monotonic() - self._last_guide_redraw) * 1000
+        if wait_ms <= 0:
+            self.redraw_distance_guides()
+        else:
+            self._guide_redraw_job = self.after(int(wait_ms) + 1, self._run_queued_guide_redraw)
+
+    def _run_queued_guide_redraw(self):
+        self._guide_redraw_job = None
+        self.redraw_distance_guides()
 
     def set_live_guide_updates(self, on: bool) -> None:
         """Toggle live redraw of distance guides during drag."""
@@ -342,7 +505,7 @@ class LayoutCanvas(tk.Frame):
             if self._guide_redraw_job:
                 self.after_cancel(self._guide_redraw_job)
                 self._guide_redraw_job = None
-            self._guide_redraw_job = self.after(0, self.redraw_distance_guides)   
+            self._guide_redraw_job = self.after(0, self._run_queued_guide_redraw)
     def draw_legend(self):
         self.legend.delete("all")
         items = [
@@ -359,7 +522,7 @@ class LayoutCanvas(tk.Frame):
 
     def on_drag_start(self, event):
         # cancel any pending redraw so we reschedule cleanly on move
-        if getattr(self, "_guide_redraw_job", None):
+        if self._guide_redraw_job:
             self.after_cancel(self._guide_redraw_job)
             self._guide_redraw_job = None
 
@@ -372,96 +535,118 @@ class LayoutCanvas(tk.Frame):
 
         # Prefer known roles
         role_tag = next((t for t in tags if t in ("shed","house","well","septic")), None)
-        if role_tag is None or role_tag == "rotate_shed":
-            # fall back to any non-generic tag, but skip rotate glyph
-            role_tag = next((t for t in tags if t not in ("draggable","rotate_shed")), None)
+        if role_tag is None:
+            # No role: fall back to the tag of the object that owns this item
+            # (never a shared tag like "object", which would move everything)
+            role_tag = next((t for t, ids in self._obj_items.items()
+                             if item_id in ids.values()), None)
 
         if not role_tag:
             return
 
+        # Resolve everything the motion handler needs once, up front
+        bx1, by1, bx2, by2 = self.canvas.bbox(self.canvas.find_withtag(role_tag)[0])
         self.drag_data["tag"] = role_tag
-        bx1, by1, bx2, by2 = self.canvas.bbox(item_id)
+        self.drag_data["role"] = role_tag if role_tag in self._tag_to_obj_getter else None
+        self.drag_data["x1"] = bx1  # top-left of the dragged body, tracked per move
+        self.drag_data["y1"] = by1
         self.drag_data["offset_x"] = event.x - bx1
         self.drag_data["offset_y"] = event.y - by1
-        
-    def on_drag_move(self, event):
-        tag = self.drag_data["tag"]
-        if tag:
-            items = self.canvas.find_withtag(tag)
-            if not items:
-                return
-
-            # current bbox BEFORE this move
-            bbox = self.canvas.bbox(items[0])
-            dx = event.x - self.drag_data["offset_x"] - bbox[0]
-            dy = event.y - self.drag_data["offset_y"] - bbox[1]
-            # 1) move all canvas items for this tag
-            for item in items:
-                self.canvas.move(item, dx, dy)
-
-            # 2) update the underlying layout in FEET (so guides recompute correctly)
-            if tag in ("shed", "house", "well", "septic"):
-                dfx = self.pixels_to_feet(dx)
-                dfy = self.pixels_to_feet(dy)
-
-                obj = getattr(self.layout, tag, None)
-                if obj is not None and obj.x is not None and obj.y is not None:
-                    obj.x += dfx
-                    obj.y += dfy
-                # NOTE: Your y is bottom-based feet (Front distance). Positive dy (down)
-                # increases pixels and correctly increases obj.y, so += dfy is right.
-
-        # 3) Live redraw (throttled) if enabled
-        if self.live_guide_updates and self.show_distance_guides:
-            if self._guide_redraw_job:
-                self.after_cancel(self._guide_redraw_job)
-            # ~30 fps (33ms). Adjust if needed.
-            self._guide_redraw_job = self.after(33, self.redraw_distance_guides)
+        self.drag_data["cell"] = (int(bx1) // GUIDE_CELL_PX, int(by1) // GUIDE_CELL_PX)
+        # Model position (in cents) before the drag; on_drag_move updates the
+        # model live, so release compares against this rather than obj.x/y
+        getter = self._tag_to_obj_getter.get(role_tag)
+        obj = getter() if getter else None
+        if obj is not None and obj.x is not None and obj.y is not None:
+            self.drag_data["start_x"] = _cents(obj.x)
+            self.drag_data["start_y"] = _cents(obj.y)
+        else:
+            self.drag_data["start_x"] = self.drag_data["start_y"] = None
 
-    def on_drag_release(self, event):
-        tag = self.drag_data["tag"]
-        if not tag:
+    def on_drag_move(self, event):
+        if not self.drag_data["tag"]:
             return
-
-        items = self.canvas.find_withtag(tag)
-        if not items:
+        # Leading-edge gate: apply at most one motion per MOTION_MIN_MS; the
+        # newest skipped one is applied by a trailing flush so the object
+        # always ends up under the pointer
+        now = time.monotonic()
+        if (now - self._last_motion_ts) * 1000 < MOTION_MIN_MS:
+            self._pending_motion = (event.x, event.y)
+            if self._motion_job is None:
+                self._motion_job = self.after(MOTION_MIN_MS, self._flush_motion)
             return
-
-        bbox = self.canvas.bbox(items[0])
-        new_center_x = ((bbox[0] + bbox[2]) / 2 - MARGIN_PX) / self.feet_to_pixel_ratio
-        new_center_y = ((bbox[1] + bbox[3]) / 2 - MARGIN_PX) / self.feet_to_pixel_ratio
-
-        name = tag.replace("_", " ").title()
-        #obj = getattr(self.layout, tag, None)
-        attr_map = {
-            "house": "house",
-            "shed": "shed",
-            "well": "well",
-            "septic_tank": "septic"
-        }
-        attr_name = attr_map.get(tag, tag)
-        if attr_name is None:
+        self._last_motion_ts = now
+        self._pending_motion = None
+        self._apply_motion(event.x, event.y)
+
+    def _flush_motion(self):
+        self._motion_job = None
+        if self._pending_motion is not None and self.drag_data["tag"]:
+            x, y = self._pending_motion
+            self._pending_motion = None
+            self._last_motion_ts = time.monotonic()
+            self._apply_motion(x, y)
+
+    def _apply_motion(self, x, y):
+        d = self.drag_data
+        tag = d["tag"]
+        if not tag:
             return
+        # Position BEFORE this move comes from drag_data, not a Tk bbox query
+        x1, y1 = d["x1"], d["y1"]
+        dx = x - d["offset_x"] - x1
+        dy = y - d["offset_y"] - y1
+        d["x1"] = x1 = x1 + dx
+        d["y1"] = y1 = y1 + dy
+        # 1) move all canvas items for this tag in one call
+        self.canvas.move(tag, dx, dy)
+
+        # 2) update the underlying layout in FEET (so guides recompute correctly)
+        role = d["role"]
+        if role:
+            obj = self._tag_to_obj_getter[role]()
+            if obj is not None and obj.x is not None and obj.y is not None:
+                ft_per_px = 1.0 / self.feet_to_pixel_ratio
+                obj.x += dx * ft_per_px
+                # y is bottom-based feet: moving down the canvas (dy > 0) means
+                # closer to the front line, so obj.y shrinks
+                obj.y -= dy * ft_per_px
+                obj.mark_dirty()
+
+        # 3) Live redraw (throttled to GUIDE_REDRAW_MS) if enabled, and only once
+        #    the object has moved into a different GUIDE_CELL_PX cell
+        if self.live_guide_updates and self.show_distance_guides:
+            cell = (int(x1) // GUIDE_CELL_PX, int(y1) // GUIDE_CELL_PX)
+            if cell != d["cell"]:
+                d["cell"] = cell
+                self._throttled_guide_redraw()
 
-        obj = cast(Union[RectangleObject, PointObject], getattr(self.layout, attr_name))
+    def on_drag_release(self, event):
+        # Land any motion the gate was still holding back
+        if self._motion_job:
+            self.after_cancel(self._motion_job)
+        self._flush_motion()
 
-        if obj.x is None or obj.y is None:
+        tag = self.drag_data["tag"]
+        attr_name = self.drag_data["role"]
+        if not tag or not attr_name:
+            self.drag_data["tag"] = None
             return
 
-        if isinstance(obj, PointObject):
-            new_x = round(new_center_x, 2)
-            new_y = round(self.layout.left - new_center_y, 2)
-        elif isinstance(obj, RectangleObject):
-            new_x = round(new_center_x - obj.width / 2, 2)
-            new_y = round(self.layout.left - new_center_y - obj.height / 2, 2)
-        else:
+        obj = cast(Union[RectangleObject, PointObject], self._tag_to_obj_getter[attr_name]())
+
+        if obj is None or obj.x is None or obj.y is None:
+            self.drag_data["tag"] = None
             return
 
-        old_x = round(obj.x, 2) if obj.x is not None else None
-        old_y = round(obj.y, 2) if obj.y is not None else None
+        # on_drag_move kept the model in step with the pointer, so the drop
+        # position is already in obj; store it to the hundredth of a foot
+        new_xc = _cents(obj.x)
+        new_yc = _cents(obj.y)
 
-        if (old_x, old_y) == (new_x, new_y):
+        if (self.drag_data["start_x"], self.drag_data["start_y"]) == (new_xc, new_yc):
             # NEW: finalize guides even if nothing moved (optional)
+            self._sync_object_to_canvas(attr_name)
             if self._guide_redraw_job:
                 self.after_cancel(self._guide_redraw_job)
                 self._guide_redraw_job = None
@@ -469,30 +654,71 @@ class LayoutCanvas(tk.Frame):
             self.drag_data["tag"] = None
             return
 
-        self.layout.update_object_position(name, new_x, new_y)
-        # print(f"[DEBUG] Updated {tag} to unflipped x={new_x}, y={new_y}")
-        save_layout_to_file(self.layout, self.filename)
+        new_x, new_y = new_xc / 100, new_yc / 100
+        self.layout.update_object_position(attr_name, new_x, new_y)
+        log.debug("Updated %s to unflipped x=%s, y=%s", tag, new_x, new_y)
+        # Snap just this object's items to the stored position; nothing else changed
+        self._sync_object_to_canvas(attr_name)
+        self._schedule_save()
 
-        if callable(getattr(self, "on_layout_changed", None)):
+        if callable(self.on_layout_changed):
             try:
                 self.on_layout_changed()
             except Exception as e:
                 print("[WARN] on_layout_changed callback failed:", e)
         
-        if hasattr(self, "_guide_redraw_job") and self._guide_redraw_job:
+        if self._guide_redraw_job:
             self.after_cancel(self._guide_redraw_job)
             self._guide_redraw_job = None
         self.redraw_distance_guides()
 
         self.drag_data["tag"] = None
 
+    def _sync_object_to_canvas(self, attr_name: str):
+        """Reposition one object's canvas items from the model; grid, legend and
+        the other objects are left alone."""
+        obj = self._tag_to_obj_getter[attr_name]()
+        draw = self._draw_rect if isinstance(obj, RectangleObject) else self._draw_point
+        draw(obj, self.feet_to_pixel_ratio, self._left_ft)
+
+    # ===== Saving =====
+
+    def _schedule_save(self):
+        """Coalesce quick successive drops into one write, SAVE_DEBOUNCE_MS after the last."""
+        if self._save_job:
+            self.after_cancel(self._save_job)
+        self._save_job = self.after(SAVE_DEBOUNCE_MS, self._flush_save)
+
+    def _flush_save(self):
+        # Snapshot on the Tk thread so a drag in progress can't change the data mid-write
+        self._save_job = None
+        data = self.layout.to_dict()
+        self._save_future = _save_pool.submit(self._write_layout, data, self.filename)
+
+    @staticmethod
+    def _write_layout(data, filename):
+        try:
+            save_layout_to_file(data, filename)
+        except Exception as e:
+            print("[WARN] Saving layout failed:", e)
+
+    def destroy(self):
+        # Don't lose a drop made just before the window closed; on_edit_layout
+        # in gui_main_menu also counts on disk matching memory once we're gone
+        if self._save_job:
+            self.after_cancel(self._save_job)
+            self._flush_save()
+        if self._save_future is not None:
+            self._save_future.result()
+        super().destroy()
+
     def rotate_shed(self, _event):
         shed = self.layout.shed
         if shed.x is None or shed.y is None:
             return
 
         # Flip Y back to unflipped so rotation math works on real coordinates
-        real_y = self.layout.left - shed.y - shed.height
+        real_y = self._left_ft - shed.y - shed.height
 
         # Compute center based on unflipped coordinates
         center_x = shed.x + shed.width / 2
@@ -506,15 +732,20 @@ class LayoutCanvas(tk.Frame):
         real_y = center_y - shed.height / 2
 
         # Flip Y back for canvas display
-        shed.y = self.layout.left - real_y - shed.height
+        shed.y = self._left_ft - real_y - shed.height
+        shed.mark_dirty()
 
-        self.draw_objects()
+        # Only the shed changed: reposition its items and re-measure the guides
+        self._sync_object_to_canvas("shed")
+        self.redraw_distance_guides()
 
     def update_canvas_dimensions(self):
-        total_width_ft = self.layout.front
-        total_height_ft = self.layout.left
+        """Resize the canvas for the current zoom; call after changing the property size too."""
+        total_width_ft = self._front_ft = float(self.layout.front)
+        total_height_ft = self._left_ft = float(self.layout.left)
         self.canvas_width = int(total_width_ft * self.feet_to_pixel_ratio)
         self.canvas_height = int(total_height_ft * self.feet_to_pixel_ratio)
+        self._grid_dirty = True
         self.canvas.config(
             width=self.canvas_width + MARGIN_PX,
             height=self.canvas_height + MARGIN_PX
@@ -534,47 +765,23 @@ class LayoutCanvas(tk.Frame):
 
      # ===== Distance Guides: helpers and API =====
 
-    def _feet(self, px: float) -> float:
-        # Convert pixels to feet using your active scale
-        return px / float(self.px_per_ft)
-
-    def _find_bbox_px(self, tag_candidates):
-        """
-        Return (x1, y1, x2, y2) for the first tag that exists, else None.
-        tag_candidates can be a string or list/tuple of strings.
-        """
-        if isinstance(tag_candidates, (list, tuple)):
-            for t in tag_candidates:
-                bb = self.canvas.bbox(t)
-                if bb:
-                    return bb
-            return None
-        return self.canvas.bbox(tag_candidates)
-
     def _property_bbox_from_layout(self):
         """Compute property bbox (px) from layout.front (width) and layout.left (height)."""
         x1 = MARGIN_PX
         y1 = MARGIN_PX
-        x2 = MARGIN_PX + self.feet_to_pixels(self.layout.front)
-        y2 = MARGIN_PX + self.feet_to_pixels(self.layout.left)
-        return (x1, y1, x2, y2)
-
-    def _bbox_union(self, item_ids):
-        """Union bbox for a list of canvas items."""
-        boxes = [self.canvas.bbox(i) for i in item_ids if self.canvas.bbox(i)]
-        if not boxes:
-            return None
-        x1 = min(b[0] for b in boxes)
-        y1 = min(b[1] for b in boxes)
-        x2 = max(b[2] for b in boxes)
-        y2 = max(b[3] for b in boxes)
+        x2 = MARGIN_PX + self.feet_to_pixels(self._front_ft)
+        y2 = MARGIN_PX + self.feet_to_pixels(self._left_ft)
         return (x1, y1, x2, y2)
 
     def _shed_body_bbox_px(self):
-        """BBox of the shed rectangle(s) only (exclude rotate glyph / labels)."""
-        items = self.canvas.find_withtag("shed")
-        rects = [i for i in items if self.canvas.type(i) == "rectangle"]
-        return self._bbox_union(rects)
+        """BBox (px) of the shed rectangle, computed from the layout model."""
+        s = self.layout.shed
+        if not s or s.x is None or s.y is None:
+            return None
+        r = self.feet_to_pixel_ratio
+        x1 = s.x * r + MARGIN_PX
+        y1 = (self._left_ft - s.y - s.height) * r + MARGIN_PX
+        return (x1, y1, x1 + s.width * r, y1 + s.height * r)
 
     def _shed_distances_ft(self):
         """Return exact (left_ft, right_ft, front_ft, back_ft) from the layout model."""
@@ -585,9 +792,9 @@ class LayoutCanvas(tk.Frame):
         # x = distance from LEFT property line to shed LEFT edge
         # y = distance from FRONT property line (top) to shed FRONT edge
         left_ft  = max(0.0, s.x)
-        right_ft = max(0.0, self.layout.front - (s.x + s.width))
+        right_ft = max(0.0, self._front_ft - (s.x + s.width))
         front_ft = max(0.0, s.y)
-        back_ft  = max(0.0, self.layout.left - (s.y + s.height))
+        back_ft  = max(0.0, self._left_ft - (s.y + s.height))
         return (left_ft, right_ft, front_ft, back_ft)
 
 
@@ -596,82 +803,113 @@ class LayoutCanvas(tk.Frame):
         self.show_distance_guides = bool(on)
         self.redraw_distance_guides()
 
+    def _guide_key(self):
+        """Everything the guides depend on; equal keys mean identical guides."""
+        L = self.layout
+        return (
+            self.show_distance_guides, self.live_guide_updates, self.feet_to_pixel_ratio,
+            *((o.x, o.y, getattr(o, "width", None), getattr(o, "height", None)) if o else None
+              for o in (L.house, L.shed, L.well, L.septic)),
+        )
+
+    def _ensure_guide_items(self):
+        """Create the shed→property guide items once (hidden): one dashed line
+        per axis and four labels. Redraws only move, relabel and show/hide them."""
+        if self._guide_items is None:
+            lines = tuple(
+                self.canvas.create_line(
+                    0, 0, 0, 0, dash=GUIDE_DASH, width=1, fill=GUIDE_LINE_FILL,
+                    state="hidden", tags=("distance_guide", "guide_line")
+                )
+                for _axis in ("h", "v")
+            )
+            # left / right labels sit above their line, back / front labels beside it
+            labels = tuple(
+                self.canvas.create_text(
+                    0, 0, font=GUIDE_FONT, fill=GUIDE_TEXT_FILL, anchor=anchor,
+                    state="hidden", tags=("distance_guide", "guide_label")
+                )
+                for anchor in ("s", "s", "w", "w")
+            )
+            self._guide_items = (*lines, labels)
+            self._restack()
+        return self._guide_items
+
+    def _hide_guides(self):
+        # All guide lines and labels share the tag: one call hides them
+        self.canvas.itemconfigure("distance_guide", state="hidden")
+        self._clear_shed_object_distances()
+
     def redraw_distance_guides(self) -> None:
         """Draw light dashed lines + ft labels from shed to property edges."""
-        # Clear previous guides
-        self.canvas.delete("distance_guide")
-        self.canvas.delete("guide_objdist")
-
-        if not getattr(self, "show_distance_guides", False):
+        self._last_guide_redraw = time.monotonic()
+        # Nothing moved since the last redraw -> the guides on screen are current
+        key = self._guide_key()
+        if key == self._last_guide_key:
             return
+        self._last_guide_key = key
 
-        # Need the shed and the property bounds (in pixels) to place the lines
-        # Use shed RECTANGLE bbox only (exclude rotate glyph / labels)
-        shed_bb = self._shed_body_bbox_px() or self._find_bbox_px("shed")
+        guides = self._ensure_guide_items()
+
+        # Need the shed and the property bounds (in pixels) to place the lines;
+        # both come from the model, so no canvas queries are needed here
+        shed_bb = self._shed_body_bbox_px() if self.show_distance_guides else None
         if not shed_bb:
+            self._hide_guides()
             return
         sx1, sy1, sx2, sy2 = shed_bb
         shed_cx = (sx1 + sx2) / 2
         shed_cy = (sy1 + sy2) / 2
 
-        prop_bb = self._find_bbox_px(["property", "boundary"]) or self._property_bbox_from_layout()
-        px1, py1, px2, py2 = prop_bb
+        px1, py1, px2, py2 = self._property_bbox_from_layout()
 
         # Exact distances in FEET for labels
         if self.live_guide_updates:
             # derive from current pixel geometry (top=back, bottom=front)
-            left_ft  = self._feet(max(0, sx1 - px1))
-            right_ft = self._feet(max(0, px2 - sx2))
-            back_ft  = self._feet(max(0, sy1 - py1))   # top segment
-            front_ft = self._feet(max(0, py2 - sy2))   # bottom segment
+            ft_per_px = 1.0 / self.px_per_ft
+            left_ft  = max(0, sx1 - px1) * ft_per_px
+            right_ft = max(0, px2 - sx2) * ft_per_px
+            back_ft  = max(0, sy1 - py1) * ft_per_px   # top segment
+            front_ft = max(0, py2 - sy2) * ft_per_px   # bottom segment
         else:
             d = self._shed_distances_ft()
             if not d:
+                self._hide_guides()
                 return
             left_ft, right_ft, front_ft, back_ft = d
 
-        # Helpers: draw lines in px; label with ft
-        def draw_h_guide(x_start, x_end, y, dist_ft: float):
-            line_id = self.canvas.create_line(
-                x_start, y, x_end, y, dash=(4, 3), width=1, fill="#BFBFBF",
-                tags=("distance_guide",)
-            )
-            self.canvas.tag_lower(line_id)
-            if dist_ft > 0:
-                midx = (x_start + x_end) / 2
-                self.canvas.create_text(
-                    midx, y - 8, text=f"{dist_ft:.1f} ft",
-                    font=("TkDefaultFont", 8), fill="#666666", anchor="s",
-                    tags=("distance_guide",)
-                )
-
-        def draw_v_guide(x, y_start, y_end, dist_ft: float):
-            line_id = self.canvas.create_line(
-                x, y_start, x, y_end, dash=(4, 3), width=1, fill="#BFBFBF",
-                tags=("distance_guide",)
-            )
-            self.canvas.tag_lower(line_id)
-            if dist_ft > 0:
-                midy = (y_start + y_end) / 2
-                self.canvas.create_text(
-                    x + 8, midy, text=f"{dist_ft:.1f} ft",
-                    font=("TkDefaultFont", 8), fill="#666666", anchor="w",
-                    tags=("distance_guide",)
-                )
+        canvas = self.canvas
+        h_line, v_line, (left_lbl, right_lbl, back_lbl, front_lbl) = guides
+        # One dashed line per axis from edge to edge through the shed; the shed
+        # body sits in a higher layer and hides the part between its own sides
+        canvas.coords(h_line, min(px1, sx1), shed_cy, max(px2, sx2), shed_cy)
+        canvas.coords(v_line, shed_cx, min(py1, sy1), shed_cx, max(py2, sy2))
+        canvas.itemconfigure("guide_line", state="normal")
+
+        # Helper: label a guide segment with ft; hidden at 0 ft or when the
+        # segment is too short to see (shed touching that edge)
+        def place_label(label_id, gap_px, label_x, label_y, dist_ft: float):
+            if dist_ft > 0 and gap_px >= GUIDE_MIN_PX:
+                canvas.coords(label_id, label_x, label_y)
+                canvas.itemconfigure(label_id, text=f"{dist_ft:.1f} ft", state="normal")
+            else:
+                canvas.itemconfigure(label_id, state="hidden")
 
         # Horizontal guides: left / right (unchanged)
-        draw_h_guide(px1, sx1, shed_cy, left_ft)
-        draw_h_guide(sx2, px2, shed_cy, right_ft)
+        place_label(left_lbl, sx1 - px1, (px1 + sx1) / 2, shed_cy - 8, left_ft)
+        place_label(right_lbl, px2 - sx2, (sx2 + px2) / 2, shed_cy - 8, right_ft)
 
         # Vertical guides: SWAP which labels go top vs bottom
         # Top segment (py1..sy1) should show BACK
-        draw_v_guide(shed_cx, py1, sy1, back_ft)
+        place_label(back_lbl, sy1 - py1, shed_cx + 8, (py1 + sy1) / 2, back_ft)
         # Bottom segment (sy2..py2) should show FRONT
-        draw_v_guide(shed_cx, sy2, py2, front_ft)
+        place_label(front_lbl, py2 - sy2, shed_cx + 8, (sy2 + py2) / 2, front_ft)
 
         # --- NEW: colored shed→object guides ---
-        if getattr(self, "show_object_distances", True):
-            self._draw_shed_object_distances() 
+        if self.show_object_distances:
+            self._draw_shed_object_distances()
+        else:
+            self._clear_shed_object_distances()
 
     def rotate_shed_by_click(self, _event):
         self.rotate_shed(_event)
@@ -7,7 +7,7 @@ methods to convert data to/from dictionaries and handle JSON file I/O.
 """
 
 import json
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from typing import Optional, Dict
 
 # Normalize any name to a canonical role if possible
@@ -31,8 +31,21 @@ except Exception:
         return None
 
 
-@dataclass
-class RectangleObject:
+class _TracksChanges:
+    """Mixin: a dirty flag that edit sites set with mark_dirty().
+
+    The slot starts unset, which reads as dirty, so fresh instances are saved.
+    """
+
+    __slots__ = ("_dirty",)
+
+    def mark_dirty(self):
+        """Record that a field changed since the last save."""
+        self._dirty = True
+
+
+@dataclass(slots=True)
+class RectangleObject(_TracksChanges):
     """
     Represents a rectangular object in the layout, such as a house or shed.
 
@@ -51,10 +64,11 @@ class RectangleObject:
 
     def to_dict(self):
         """Converts the object to a dictionary."""
-        return asdict(self)
+        return {"name": self.name, "width": self.width, "height": self.height,
+                "x": self.x, "y": self.y}
 
-@dataclass
-class PointObject:
+@dataclass(slots=True)
+class PointObject(_TracksChanges):
     """
     Represents a point-like object in the layout, such as a well or septic tank.
 
@@ -69,10 +83,10 @@ class PointObject:
 
     def to_dict(self):
         """Converts the object to a dictionary."""
-        return asdict(self)
+        return {"name": self.name, "x": self.x, "y": self.y}
 
-@dataclass
-class LayoutData:
+@dataclass(slots=True)
+class LayoutData(_TracksChanges):
     """
     Represents the entire layout, including boundaries and all objects.
 
@@ -95,6 +109,33 @@ class LayoutData:
     well:  Optional[PointObject]  = field(default_factory=lambda: PointObject(name="Well"))
     septic: Optional[PointObject] = field(default_factory=lambda: PointObject(name="Septic Tank"))
 
+    # (cache key, bytes) written by the last save; reused while nothing changes
+    _payload_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    def _objects(self):
+        return (self.house, self.shed, self.well, self.septic)
+
+    def _cache_key(self, pretty: bool) -> tuple:
+        """Output format plus the layout's own fields. Plain assignments to these
+        don't go through mark_dirty(), so a saved payload is only reused while
+        they still match; edits inside the objects are caught by their flags."""
+        return (pretty, self.front, self.back, self.left, self.right,
+                id(self.house), id(self.shed), id(self.well), id(self.septic))
+
+    @property
+    def dirty(self) -> bool:
+        """True if the layout or any of its objects changed since mark_clean()."""
+        if getattr(self, "_dirty", True):
+            return True
+        return any(o is not None and getattr(o, "_dirty", True) for o in self._objects())
+
+    def mark_clean(self):
+        """Record that the current state has been serialized."""
+        self._dirty = False
+        for o in self._objects():
+            if o is not None:
+                o._dirty = False
+
     def to_dict(self):
         """Serialize the layout and omit objects that aren't included."""
         objs = {}
@@ -160,8 +201,9 @@ class LayoutData:
         Args:
             filepath (str): Path to the output JSON file.
         """
+        text = json.dumps(self.to_dict(), indent=4)
         with open(filepath, 'w') as f:
-            json.dump(self.to_dict(), f, indent=4)
+            f.write(text)
 
     @staticmethod
     def load_from_json(filepath: str):
@@ -202,6 +244,7 @@ class LayoutData:
             raise ValueError(f"Unknown object name: {name}")
         obj.x = x
         obj.y = y
+        obj.mark_dirty()
 
 
     def edit_dimensions(self, name: str, width: float, height: float):
@@ -213,4 +256,5 @@ class LayoutData:
             raise ValueError(f"Unknown rectangle object: {name}")
         obj.width = width
         obj.height = height
+        obj.mark_dirty()
 
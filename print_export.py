@@ -162,7 +162,7 @@ def export_to_pdf(layout, filename, **_ignored):
     # Objects
     # was: draw_rect(layout.house, colors.Color(0.2, 0.5, 0.9)), now it copies the object colors from the PDF
 
-    if PDF_COLOR_DEBUG and getattr(layout, "septic", None):
+    if __debug__ and PDF_COLOR_DEBUG and getattr(layout, "septic", None):
         print(f"[PDF COLOR DEBUG] septic PDF color {PDF['septic']}")
     draw_rect(layout.house, colors.Color(*PDF["house"]))
     draw_rect(layout.shed,  colors.Color(*PDF["shed"]))
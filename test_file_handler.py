@@ -0,0 +1,30 @@
+import file_handler
+from file_handler import load_layout_from_file, save_layout_to_file
+from layout_data import LayoutData, RectangleObject
+
+
+def _layout():
+    return LayoutData(front=100, back=100, left=80, right=80,
+                      house=RectangleObject("House", 30, 20, 10, 40), shed=None)
+
+
+def _resave(tmp_path, monkeypatch, edit):
+    monkeypatch.setattr(file_handler, "_save_dir_ready", True)
+    path = str(tmp_path / "yard.json")
+    layout = _layout()
+    save_layout_to_file(layout, path)
+    edit(layout)
+    save_layout_to_file(layout, path)
+    return load_layout_from_file(path)[0]
+
+
+def test_resave_picks_up_boundary_assignment(tmp_path, monkeypatch):
+    def edit(layout):
+        layout.front = 200
+    assert _resave(tmp_path, monkeypatch, edit).front == 200
+
+
+def test_resave_picks_up_removed_object(tmp_path, monkeypatch):
+    def edit(layout):
+        layout.house = None
+    assert _resave(tmp_path, monkeypatch, edit).house is None
@@ -13,7 +13,8 @@ def display_layout_canvas(layout, filename):
 
     # Silent save after canvas closes
     if filename and filename.endswith(".json"):
+        text = json.dumps(layout.to_dict(), indent=2)
         with open(filename, 'w') as f:
-            json.dump(layout.to_dict(), f, indent=2)
+            f.write(text)
         msg.showinfo("Saved", "Changes to the layout have been saved.")
 